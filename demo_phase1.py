@@ -3,37 +3,61 @@
 
 import sys
 import json
-sys.path.insert(0, 'src')
-
-from gtm_mcp.constants import TriggerType, TagType, VariableType
-from gtm_mcp.validators import validate_ga4_event_name, validate_scroll_percentages
-from gtm_mcp.helpers import (
+from types import MappingProxyType
+from typing import Final
+
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib encoder
+    orjson = None
+
+from unboundai_gtm_mcp.constants import (
+    TAG_TYPES,
+    TRIGGER_TYPES,
+    VARIABLE_TYPES,
+    TriggerType,
+)
+from unboundai_gtm_mcp.validators import validate_ga4_event_name, validate_scroll_percentages
+from unboundai_gtm_mcp.helpers import (
     build_ga4_event_tag,
     build_scroll_percentage_list,
     build_custom_event_filter,
 )
 
-def print_section(title: str):
-    """Print a section header."""
-    print("\n" + "=" * 70)
-    print(f"  {title}")
-    print("=" * 70)
+RULE = "=" * 70
 
-def print_json(data: dict, label: str = ""):
-    """Pretty print JSON data."""
-    if label:
-        print(f"\n{label}:")
-    print(json.dumps(data, indent=2))
+# Trigger type values used by the demo payloads, resolved once at import
+_T_SCROLL: Final[str] = TriggerType.SCROLL_DEPTH.value
+_T_CE: Final[str] = TriggerType.CUSTOM_EVENT.value
+
+# Read-only fixed fields shared by every trigger of a kind; callers splice
+# in the per-trigger fields when building a payload
+_SCROLL_TEMPLATE = MappingProxyType({"type": _T_SCROLL})
+_CE_TEMPLATE = MappingProxyType({"type": _T_CE})
+
+# Type counts are fixed at import
+_N_TRIGGER_TYPES: Final[int] = len(TRIGGER_TYPES)
+_N_TAG_TYPES: Final[int] = len(TAG_TYPES)
+_N_VARIABLE_TYPES: Final[int] = len(VARIABLE_TYPES)
+
+def format_section(title: str) -> str:
+    """Format a section header."""
+    return f"\n{RULE}\n  {title}\n{RULE}\n"
 
-def demo_scroll_depth_trigger():
-    """Demonstrate scroll depth trigger creation."""
-    print_section("DEMO 1: Scroll Depth Trigger")
+def dumps_json(data: dict) -> str:
+    """Serialize data as indented JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
 
-    print("\n❌ BEFORE Phase 1:")
-    print("  • Manual nested structure")
-    print("  • Easy to get wrong (case, types, nesting)")
-    print("  • 20+ lines of code")
+def format_json(data: dict, label: str = "") -> str:
+    """Format data as pretty-printed JSON, optionally preceded by a label."""
+    if label:
+        return f"\n{label}:\n{dumps_json(data)}\n"
+    return f"{dumps_json(data)}\n"
 
+def demo_scroll_depth_trigger() -> str:
+    """Render the scroll depth trigger demo."""
     # Simulating the old way (would often fail)
     before = {
         "name": "Scroll Depth - 25-50-75-100",
@@ -49,12 +73,6 @@ def demo_scroll_depth_trigger():
             ]
         }
     }
-    print_json(before, "  Old way (FAILS - wrong format)")
-
-    print("\n✅ AFTER Phase 1:")
-    print("  • Type-safe enums")
-    print("  • Automatic structure building")
-    print("  • 5 lines of code")
 
     # The new way (guaranteed correct)
     percentages = validate_scroll_percentages([25, 50, 75, 100])
@@ -62,26 +80,24 @@ def demo_scroll_depth_trigger():
 
     after = {
         "name": "Scroll Depth - 25-50-75-100",
-        "type": TriggerType.SCROLL_DEPTH.value,
+        **_SCROLL_TEMPLATE,
         "verticalScrollPercentageList": scroll_config
     }
-    print_json(after, "  New way (SUCCESS - correct format)")
-
-def demo_ga4_event_tag():
-    """Demonstrate GA4 event tag creation."""
-    print_section("DEMO 2: GA4 Event Tag")
-
-    print("\n❌ BEFORE Phase 1:")
-    print("  • 50+ lines of nested structures")
-    print("  • Multiple opportunities for errors")
-    print("  • Hard to read and maintain")
-    print("  • (Too long to show here)")
-
-    print("\n✅ AFTER Phase 1:")
-    print("  • 10 lines of clear code")
-    print("  • Validated event name")
-    print("  • Correct structure guaranteed")
 
+    return f"""{format_section("DEMO 1: Scroll Depth Trigger")}
+❌ BEFORE Phase 1:
+  • Manual nested structure
+  • Easy to get wrong (case, types, nesting)
+  • 20+ lines of code
+{format_json(before, "  Old way (FAILS - wrong format)")}
+✅ AFTER Phase 1:
+  • Type-safe enums
+  • Automatic structure building
+  • 5 lines of code
+{format_json(after, "  New way (SUCCESS - correct format)")}"""
+
+def demo_ga4_event_tag() -> str:
+    """Render the GA4 event tag demo."""
     event_name = validate_ga4_event_name("purchase")
     tag = build_ga4_event_tag(
         name="GA4 - Event - Purchase",
@@ -95,141 +111,159 @@ def demo_ga4_event_tag():
         ],
         send_ecommerce=True
     )
-    print_json(tag, "  Complete GA4 tag")
-
-def demo_custom_event_trigger():
-    """Demonstrate custom event trigger creation."""
-    print_section("DEMO 3: Custom Event Trigger")
-
-    print("\n❌ BEFORE Phase 1:")
-    print("  • Manual filter structure")
-    print("  • Case-sensitive type names")
-    print("  • 15+ lines of code")
-
-    print("\n✅ AFTER Phase 1:")
-    print("  • One function call")
-    print("  • Type-safe constants")
-    print("  • 5 lines of code")
 
+    return f"""{format_section("DEMO 2: GA4 Event Tag")}
+❌ BEFORE Phase 1:
+  • 50+ lines of nested structures
+  • Multiple opportunities for errors
+  • Hard to read and maintain
+  • (Too long to show here)
+
+✅ AFTER Phase 1:
+  • 10 lines of clear code
+  • Validated event name
+  • Correct structure guaranteed
+{format_json(tag, "  Complete GA4 tag")}"""
+
+def demo_custom_event_trigger() -> str:
+    """Render the custom event trigger demo."""
     trigger = {
         "name": "CE - add_to_cart",
-        "type": TriggerType.CUSTOM_EVENT.value,
+        **_CE_TEMPLATE,
         "customEventFilter": build_custom_event_filter("add_to_cart")
     }
-    print_json(trigger, "  Custom event trigger")
-
-def demo_type_safety():
-    """Demonstrate type safety benefits."""
-    print_section("DEMO 4: Type Safety")
-
-    print("\n❌ BEFORE Phase 1:")
-    print('  trigger_type = "PAGEVEEW"  # Typo! Will fail at API level')
-    print('  tag_type = "gaawce"         # Typo! Will fail at API level')
-
-    print("\n✅ AFTER Phase 1:")
-    print("  from gtm_mcp.constants import TriggerType, TagType")
-    print("  trigger_type = TriggerType.PAGEVIEW.value  # IDE autocomplete")
-    print("  tag_type = TagType.GA4_CONFIG.value        # No typos possible")
-
-    print(f"\n  Available trigger types: {len(TriggerType)} enums")
-    print(f"  Available tag types: {len(TagType)} enums")
-    print(f"  Available variable types: {len(VariableType)} enums")
-
-def demo_validation():
-    """Demonstrate validation benefits."""
-    print_section("DEMO 5: Validation")
-
-    print("\n❌ BEFORE Phase 1:")
-    print('  event_name = "123-invalid-event"  # Would fail at API level')
-    print('  # Error: "400 Bad Request: Invalid event name"')
-
-    print("\n✅ AFTER Phase 1:")
-    print("  from gtm_mcp.validators import validate_ga4_event_name")
-    print("  from gtm_mcp.exceptions import ValidationError")
-    print("")
-    print("  try:")
-    print('      event_name = validate_ga4_event_name("123-invalid-event")')
-    print("  except ValidationError as e:")
-    print('      print(f"Error: {e.message}")')
-    print('      # "Event name must start with a letter"')
-    print('      print(f"Field: {e.details[\'field\']}")')
-    print('      # "event_name"')
-    print('      print(f"Expected: {e.details[\'expected\']}")')
-    print('      # "starts with a letter"')
-
-def demo_comparison():
-    """Show side-by-side comparison."""
-    print_section("COMPARISON: Before vs After")
-
-    print("\nCreating a scroll depth trigger:\n")
-
-    print("BEFORE Phase 1:")
-    print("-" * 70)
-    print("""
-trigger_data = {
+
+    return f"""{format_section("DEMO 3: Custom Event Trigger")}
+❌ BEFORE Phase 1:
+  • Manual filter structure
+  • Case-sensitive type names
+  • 15+ lines of code
+
+✅ AFTER Phase 1:
+  • One function call
+  • Type-safe constants
+  • 5 lines of code
+{format_json(trigger, "  Custom event trigger")}"""
+
+def demo_type_safety() -> str:
+    """Render the type safety demo."""
+    return f"""{format_section("DEMO 4: Type Safety")}
+❌ BEFORE Phase 1:
+  trigger_type = "PAGEVEEW"  # Typo! Will fail at API level
+  tag_type = "gaawce"         # Typo! Will fail at API level
+
+✅ AFTER Phase 1:
+  from unboundai_gtm_mcp.constants import TriggerType, TagType
+  trigger_type = TriggerType.PAGEVIEW.value  # IDE autocomplete
+  tag_type = TagType.GA4_CONFIG.value        # No typos possible
+
+  Available trigger types: {_N_TRIGGER_TYPES} enums
+  Available tag types: {_N_TAG_TYPES} enums
+  Available variable types: {_N_VARIABLE_TYPES} enums
+"""
+
+def demo_validation() -> str:
+    """Render the validation demo."""
+    return format_section("DEMO 5: Validation") + """
+❌ BEFORE Phase 1:
+  event_name = "123-invalid-event"  # Would fail at API level
+  # Error: "400 Bad Request: Invalid event name"
+
+✅ AFTER Phase 1:
+  from unboundai_gtm_mcp.validators import validate_ga4_event_name
+  from unboundai_gtm_mcp.exceptions import ValidationError
+
+  try:
+      event_name = validate_ga4_event_name("123-invalid-event")
+  except ValidationError as e:
+      print(f"Error: {e.message}")
+      # "Event name must start with a letter"
+      print(f"Field: {e.details['field']}")
+      # "event_name"
+      print(f"Expected: {e.details['expected']}")
+      # "starts with a letter"
+"""
+
+def demo_comparison() -> str:
+    """Render the side-by-side comparison."""
+    return format_section("COMPARISON: Before vs After") + f"""
+Creating a scroll depth trigger:
+
+BEFORE Phase 1:
+{"-" * 70}
+
+trigger_data = {{
     "name": "Scroll Depth - 25-50-75-100",
     "type": "scrollDepth",  # Case matters!
-    "verticalScrollPercentageList": {
+    "verticalScrollPercentageList": {{
         "type": "list",
         "key": "verticalScrollPercentageList",
         "list": [
-            {"type": "template", "value": "25"},
-            {"type": "template", "value": "50"},
-            {"type": "template", "value": "75"},
-            {"type": "template", "value": "100"}
+            {{"type": "template", "value": "25"}},
+            {{"type": "template", "value": "50"}},
+            {{"type": "template", "value": "75"}},
+            {{"type": "template", "value": "100"}}
         ]
-    }
-}
+    }}
+}}
 # Result: Often FAILS (wrong case, wrong structure)
 # Lines of code: 15+
 # Developer time: 30+ minutes of trial and error
-""")
 
-    print("AFTER Phase 1:")
-    print("-" * 70)
-    print("""
-from gtm_mcp.constants import TriggerType
-from gtm_mcp.helpers import build_scroll_percentage_list
+AFTER Phase 1:
+{"-" * 70}
+
+from unboundai_gtm_mcp.constants import TriggerType
+from unboundai_gtm_mcp.helpers import build_scroll_percentage_list
 
 scroll_config = build_scroll_percentage_list([25, 50, 75, 100])
-trigger_data = {
+trigger_data = {{
     "name": "Scroll Depth - 25-50-75-100",
     "type": TriggerType.SCROLL_DEPTH.value,
     "verticalScrollPercentageList": scroll_config
-}
+}}
 # Result: ALWAYS WORKS (correct structure guaranteed)
 # Lines of code: 5
 # Developer time: 2 minutes
-""")
 
-def main():
-    """Run all demos."""
-    print("\n" + "=" * 70)
-    print("  GTM MCP PHASE 1 - BEFORE/AFTER DEMONSTRATION")
-    print("=" * 70)
-
-    demo_scroll_depth_trigger()
-    demo_ga4_event_tag()
-    demo_custom_event_trigger()
-    demo_type_safety()
-    demo_validation()
-    demo_comparison()
-
-    print("\n" + "=" * 70)
-    print("  KEY BENEFITS")
-    print("=" * 70)
-    print("""
+"""
+
+def render_benefits() -> str:
+    """Render the closing benefits summary."""
+    return format_section("KEY BENEFITS") + f"""
 ✅ Correctness: Guaranteed correct GTM API structure
 ✅ Type Safety: Enums prevent string typos
 ✅ Validation: Early error detection with clear messages
 ✅ Readability: 10 lines instead of 200
 ✅ Speed: 2 minutes instead of 30+ minutes
 ✅ Reliability: Works first time, every time
-""")
 
-    print("=" * 70)
-    print("  Phase 1 Implementation: COMPLETE")
-    print("=" * 70 + "\n")
+{RULE}
+  Phase 1 Implementation: COMPLETE
+{RULE}
+
+"""
+
+def _render_all() -> str:
+    """Render the whole demo into a single string."""
+    return "".join((
+        format_section("GTM MCP PHASE 1 - BEFORE/AFTER DEMONSTRATION"),
+        demo_scroll_depth_trigger(),
+        demo_ga4_event_tag(),
+        demo_custom_event_trigger(),
+        demo_type_safety(),
+        demo_validation(),
+        demo_comparison(),
+        render_benefits(),
+    ))
+
+# Nothing in the demo depends on runtime input, so render it once at import
+_RENDERED: Final[str] = _render_all()
+
+def main():
+    """Write the pre-rendered demo to stdout."""
+    sys.stdout.write(_RENDERED)
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     main()
@@ -12,24 +12,55 @@ Phase 1 Foundation Modules:
 
 __version__ = "0.0.1"
 
-# Import commonly used items for convenience
-from .exceptions import (
-    GTMError,
-    ValidationError,
-    APIError,
-    ResourceNotFoundError,
-    PermissionError,
-    ConfigurationError,
-    ParameterFormatError,
-)
-
-from .constants import (
-    TriggerType,
-    TagType,
-    VariableType,
-    FilterType,
-    ParameterType,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Commonly used items are re-exported for convenience. They are resolved on
+# first access (PEP 562) so that importing the package for __version__ does
+# not load the submodules.
+_LAZY_ATTRS = {
+    # Exceptions
+    "GTMError": "exceptions",
+    "ValidationError": "exceptions",
+    "APIError": "exceptions",
+    "ResourceNotFoundError": "exceptions",
+    "PermissionError": "exceptions",
+    "ConfigurationError": "exceptions",
+    "ParameterFormatError": "exceptions",
+    # Constants
+    "TriggerType": "constants",
+    "TagType": "constants",
+    "VariableType": "constants",
+    "FilterType": "constants",
+    "ParameterType": "constants",
+}
+
+if TYPE_CHECKING:
+    from .constants import FilterType, ParameterType, TagType, TriggerType, VariableType
+    from .exceptions import (
+        APIError,
+        ConfigurationError,
+        GTMError,
+        ParameterFormatError,
+        PermissionError,
+        ResourceNotFoundError,
+        ValidationError,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache on the module so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     # Version
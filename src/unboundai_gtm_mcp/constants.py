@@ -6,7 +6,7 @@ Google Tag Manager API specification.
 """
 
 from enum import Enum
-from typing import Final, Set
+from typing import Final, FrozenSet
 
 
 class TriggerType(str, Enum):
@@ -153,8 +153,15 @@ class ParameterType(str, Enum):
     TRIGGER_REFERENCE = "TRIGGER_REFERENCE"  # Reference to a trigger
 
 
+# Plain-string value tables, computed once at import. Prefer these over
+# iterating the enums (or calling len() on them) in code that runs per request.
+TRIGGER_TYPES: Final[FrozenSet[str]] = frozenset(t.value for t in TriggerType)
+TAG_TYPES: Final[FrozenSet[str]] = frozenset(t.value for t in TagType)
+VARIABLE_TYPES: Final[FrozenSet[str]] = frozenset(t.value for t in VariableType)
+FILTER_TYPES: Final[FrozenSet[str]] = frozenset(t.value for t in FilterType)
+
 # Built-in variable types
-BUILT_IN_VARIABLES: Final[Set[str]] = {
+BUILT_IN_VARIABLES: Final[FrozenSet[str]] = frozenset({
     "PAGE_URL",
     "PAGE_HOSTNAME",
     "PAGE_PATH",
@@ -195,17 +202,17 @@ BUILT_IN_VARIABLES: Final[Set[str]] = {
     "ELEMENT_VISIBILITY_TIME",
     "ELEMENT_VISIBILITY_FIRST_TIME",
     "ELEMENT_VISIBILITY_RECENT_TIME",
-}
+})
 
 # Scroll depth percentages (common values)
-SCROLL_PERCENTAGES: Final[Set[int]] = {10, 25, 50, 75, 90, 100}
+SCROLL_PERCENTAGES: Final[FrozenSet[int]] = frozenset({10, 25, 50, 75, 90, 100})
 
 # Tag firing options
-TAG_FIRING_OPTIONS: Final[Set[str]] = {
+TAG_FIRING_OPTIONS: Final[FrozenSet[str]] = frozenset({
     "UNLIMITED",  # Fire every time the trigger fires
     "ONCE_PER_EVENT",  # Fire once per event
     "ONCE_PER_LOAD",  # Fire once per page load
-}
+})
 
 # GA4 event parameter name constraints
 GA4_EVENT_NAME_MAX_LENGTH: Final[int] = 40
@@ -220,26 +227,39 @@ GTM_NOTES_MAX_LENGTH: Final[int] = 5000
 DEFAULT_WORKSPACE: Final[str] = "1"  # Default workspace ID
 
 # Tag Manager scopes
-SCOPES: Final[Set[str]] = {
-    "https://www.googleapis.com/auth/tagmanager.delete.containers",
-    "https://www.googleapis.com/auth/tagmanager.edit.containers",
-    "https://www.googleapis.com/auth/tagmanager.edit.containerversions",
-    "https://www.googleapis.com/auth/tagmanager.manage.accounts",
-    "https://www.googleapis.com/auth/tagmanager.manage.users",
-    "https://www.googleapis.com/auth/tagmanager.publish",
-    "https://www.googleapis.com/auth/tagmanager.readonly",
-}
+SCOPE_PREFIX: Final[str] = "https://www.googleapis.com/auth/tagmanager."
+
+
+def scope_url(suffix: str) -> str:
+    """Return the full Tag Manager OAuth scope URL for a scope suffix.
+
+    Example:
+        >>> scope_url("readonly")
+        'https://www.googleapis.com/auth/tagmanager.readonly'
+    """
+    return SCOPE_PREFIX + suffix
+
+
+SCOPES: Final[FrozenSet[str]] = frozenset(map(scope_url, (
+    "delete.containers",
+    "edit.containers",
+    "edit.containerversions",
+    "manage.accounts",
+    "manage.users",
+    "publish",
+    "readonly",
+)))
 
 # Minimum required scopes for common operations
-MINIMUM_READ_SCOPES: Final[Set[str]] = {
-    "https://www.googleapis.com/auth/tagmanager.readonly",
-}
-
-MINIMUM_WRITE_SCOPES: Final[Set[str]] = {
-    "https://www.googleapis.com/auth/tagmanager.edit.containers",
-    "https://www.googleapis.com/auth/tagmanager.edit.containerversions",
-}
-
-MINIMUM_PUBLISH_SCOPES: Final[Set[str]] = {
-    "https://www.googleapis.com/auth/tagmanager.publish",
-}
+MINIMUM_READ_SCOPES: Final[FrozenSet[str]] = frozenset({
+    scope_url("readonly"),
+})
+
+MINIMUM_WRITE_SCOPES: Final[FrozenSet[str]] = frozenset({
+    scope_url("edit.containers"),
+    scope_url("edit.containerversions"),
+})
+
+MINIMUM_PUBLISH_SCOPES: Final[FrozenSet[str]] = frozenset({
+    scope_url("publish"),
+})
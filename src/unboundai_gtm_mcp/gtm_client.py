@@ -2,20 +2,13 @@ import os
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from googleapiclient.errors import HttpError
+from .constants import SCOPES as GTM_SCOPES
 from .utils import _authenticate
 
 SERVICE_NAME = 'tagmanager'
 VERSION = 'v2'
 TOKEN_FILE = Path.home() / '.gtm-mcp' / 'token.json'
-SCOPES = [
-    "https://www.googleapis.com/auth/tagmanager.delete.containers",
-    "https://www.googleapis.com/auth/tagmanager.edit.containers",
-    "https://www.googleapis.com/auth/tagmanager.edit.containerversions",
-    "https://www.googleapis.com/auth/tagmanager.manage.accounts",
-    "https://www.googleapis.com/auth/tagmanager.manage.users",
-    "https://www.googleapis.com/auth/tagmanager.publish",
-    "https://www.googleapis.com/auth/tagmanager.readonly"
-]
+SCOPES = sorted(GTM_SCOPES)
 
 
 class GTMClient:
@@ -5,11 +5,23 @@ structures from simple Python data types. It handles the nested type/key/value
 format required by the GTM API.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Final, Iterable, List, Optional, Sequence, Tuple, Union
 
 from .constants import ParameterType
 from .exceptions import ParameterFormatError
 
+# Parameter type strings, resolved once so builders avoid enum lookups per call
+_TYPE_TEMPLATE: Final[str] = ParameterType.TEMPLATE.value
+_TYPE_BOOLEAN: Final[str] = ParameterType.BOOLEAN.value
+_TYPE_INTEGER: Final[str] = ParameterType.INTEGER.value
+_TYPE_LIST: Final[str] = ParameterType.LIST.value
+_TYPE_MAP: Final[str] = ParameterType.MAP.value
+_TYPE_TAG_REF: Final[str] = ParameterType.TAG_REFERENCE.value
+_TYPE_TRIGGER_REF: Final[str] = ParameterType.TRIGGER_REFERENCE.value
+
+# GTM boolean parameter values, indexed by bool(value)
+_BOOL_STR: Final[Tuple[str, str]] = ("false", "true")
+
 
 def build_template_parameter(key: str, value: str) -> Dict[str, str]:
     """Build a template parameter.
@@ -31,12 +43,44 @@ def build_template_parameter(key: str, value: str) -> Dict[str, str]:
         {'type': 'TEMPLATE', 'key': 'eventName', 'value': '{{Event Name}}'}
     """
     return {
-        "type": ParameterType.TEMPLATE.value,
+        "type": _TYPE_TEMPLATE,
         "key": key,
-        "value": str(value)
+        # Skip the str() call for the common case of an actual string
+        "value": value if type(value) is str else str(value)
     }
 
 
+def build_template_parameters(
+    pairs: Iterable[Tuple[str, Any]]
+) -> List[Dict[str, str]]:
+    """Build several template parameters at once.
+
+    Equivalent to calling build_template_parameter for each pair, without
+    the per-parameter function call.
+
+    Args:
+        pairs: (key, value) pairs; values are converted to strings
+
+    Returns:
+        List of GTM API parameter structures, in input order
+
+    Example:
+        >>> build_template_parameters([("name", "currency"), ("value", "DKK")])
+        [
+            {'type': 'TEMPLATE', 'key': 'name', 'value': 'currency'},
+            {'type': 'TEMPLATE', 'key': 'value', 'value': 'DKK'}
+        ]
+    """
+    return [
+        {
+            "type": _TYPE_TEMPLATE,
+            "key": key,
+            "value": value if type(value) is str else str(value)
+        }
+        for key, value in pairs
+    ]
+
+
 def build_boolean_parameter(key: str, value: bool) -> Dict[str, Union[str, bool]]:
     """Build a boolean parameter.
 
@@ -52,9 +96,9 @@ def build_boolean_parameter(key: str, value: bool) -> Dict[str, Union[str, bool]
         {'type': 'BOOLEAN', 'key': 'sendPageView', 'value': 'true'}
     """
     return {
-        "type": ParameterType.BOOLEAN.value,
+        "type": _TYPE_BOOLEAN,
         "key": key,
-        "value": "true" if value else "false"
+        "value": _BOOL_STR[bool(value)]
     }
 
 
@@ -73,7 +117,7 @@ def build_integer_parameter(key: str, value: int) -> Dict[str, Union[str, int]]:
         {'type': 'INTEGER', 'key': 'dataLayerVersion', 'value': '2'}
     """
     return {
-        "type": ParameterType.INTEGER.value,
+        "type": _TYPE_INTEGER,
         "key": key,
         "value": str(value)
     }
@@ -105,7 +149,7 @@ def build_list_parameter(
         }
     """
     return {
-        "type": ParameterType.LIST.value,
+        "type": _TYPE_LIST,
         "key": key,
         "list": items
     }
@@ -131,7 +175,7 @@ def build_map_parameter(
         {'type': 'MAP', 'map': [...]}
     """
     return {
-        "type": ParameterType.MAP.value,
+        "type": _TYPE_MAP,
         "map": key_value_pairs
     }
 
@@ -154,7 +198,7 @@ def build_tag_reference_parameter(
         {'type': 'TAG_REFERENCE', 'key': 'measurementId', 'value': 'GA4 - Config'}
     """
     return {
-        "type": ParameterType.TAG_REFERENCE.value,
+        "type": _TYPE_TAG_REF,
         "key": key,
         "value": tag_name
     }
@@ -176,8 +220,8 @@ def build_trigger_reference_parameter(
         {'type': 'TRIGGER_REFERENCE', 'value': '12345'}
     """
     return {
-        "type": ParameterType.TRIGGER_REFERENCE.value,
-        "value": str(trigger_id)
+        "type": _TYPE_TRIGGER_REF,
+        "value": trigger_id if type(trigger_id) is str else str(trigger_id)
     }
 
 
@@ -203,10 +247,13 @@ def build_event_parameter(name: str, value: str) -> Dict[str, Any]:
             ]
         }
     """
-    return build_map_parameter([
-        build_template_parameter("name", name),
-        build_template_parameter("value", value)
-    ])
+    return {
+        "type": _TYPE_MAP,
+        "map": [
+            {"type": _TYPE_TEMPLATE, "key": "name", "value": str(name)},
+            {"type": _TYPE_TEMPLATE, "key": "value", "value": str(value)}
+        ]
+    }
 
 
 def build_event_parameters_list(
@@ -237,14 +284,25 @@ def build_event_parameters_list(
             ...
         ]
     """
+    # Same structure as build_event_parameter, inlined to skip the call per item
     return [
-        build_event_parameter(param["name"], param["value"])
+        {
+            "type": _TYPE_MAP,
+            "map": [
+                {"type": _TYPE_TEMPLATE, "key": "name", "value": str(param["name"])},
+                {"type": _TYPE_TEMPLATE, "key": "value", "value": str(param["value"])}
+            ]
+        }
         for param in parameters
     ]
 
 
+# Template values for every valid scroll percentage, indexed by percentage
+_SCROLL_PCT_STRINGS: Final[Tuple[str, ...]] = tuple(str(pct) for pct in range(101))
+
+
 def build_scroll_percentage_list(
-    percentages: List[int]
+    percentages: Sequence[int]
 ) -> Dict[str, Any]:
     """Build scroll percentage list parameter.
 
@@ -269,15 +327,50 @@ def build_scroll_percentage_list(
         }
     """
     return {
-        "type": ParameterType.LIST.value,
+        "type": _TYPE_LIST,
         "key": "verticalScrollPercentageList",
         "list": [
-            {"type": ParameterType.TEMPLATE.value, "value": str(pct)}
+            {
+                "type": _TYPE_TEMPLATE,
+                "value": (
+                    _SCROLL_PCT_STRINGS[pct]
+                    if type(pct) is int and 0 <= pct <= 100
+                    else str(pct)
+                )
+            }
             for pct in percentages
         ]
     }
 
 
+def _make_binary_filter(
+    match_type: str,
+    arg0: str,
+    arg1: str
+) -> List[Dict[str, Any]]:
+    """Build a single-condition trigger filter comparing arg0 against arg1.
+
+    Both arguments are coerced to strings, as build_template_parameter does.
+    """
+    return [
+        {
+            "type": match_type,
+            "parameter": [
+                {
+                    "type": _TYPE_TEMPLATE,
+                    "key": "arg0",
+                    "value": arg0 if type(arg0) is str else str(arg0)
+                },
+                {
+                    "type": _TYPE_TEMPLATE,
+                    "key": "arg1",
+                    "value": arg1 if type(arg1) is str else str(arg1)
+                }
+            ]
+        }
+    ]
+
+
 def build_custom_event_filter(
     event_name: str,
     match_type: str = "EQUALS"
@@ -344,15 +437,7 @@ def build_custom_event_filter(
             expected_structure="non-empty string"
         )
 
-    return [
-        {
-            "type": match_type,
-            "parameter": [
-                build_template_parameter("arg0", "{{_event}}"),
-                build_template_parameter("arg1", event_name)
-            ]
-        }
-    ]
+    return _make_binary_filter(match_type, "{{_event}}", event_name)
 
 
 def build_url_filter(
@@ -382,15 +467,7 @@ def build_url_filter(
             }
         ]
     """
-    return [
-        {
-            "type": match_type,
-            "parameter": [
-                build_template_parameter("arg0", variable),
-                build_template_parameter("arg1", pattern)
-            ]
-        }
-    ]
+    return _make_binary_filter(match_type, variable, pattern)
 
 
 def build_click_filter(
@@ -420,7 +497,7 @@ def build_click_filter(
             }
         ]
     """
-    return build_url_filter(click_property, match_type, pattern)
+    return _make_binary_filter(match_type, click_property, pattern)
 
 
 def build_workspace_path(
@@ -442,7 +519,9 @@ def build_workspace_path(
         >>> build_workspace_path("123456", "789012", "5")
         'accounts/123456/containers/789012/workspaces/5'
     """
-    return f"accounts/{account_id}/containers/{container_id}/workspaces/{workspace_id}"
+    return "/".join(
+        ("accounts", account_id, "containers", container_id, "workspaces", workspace_id)
+    )
 
 
 def build_container_path(account_id: str, container_id: str) -> str:
@@ -459,7 +538,7 @@ def build_container_path(account_id: str, container_id: str) -> str:
         >>> build_container_path("123456", "789012")
         'accounts/123456/containers/789012'
     """
-    return f"accounts/{account_id}/containers/{container_id}"
+    return "/".join(("accounts", account_id, "containers", container_id))
 
 
 def extract_id_from_path(path: str, resource_type: str) -> str:
@@ -520,16 +599,19 @@ def parse_workspace_path(
         }
     """
     try:
-        parts = path.split("/")
-        if len(parts) != 6:
-            raise ValueError("Invalid path length")
+        # Unpacking checks the segment count; the names are checked below
+        accounts, account_id, containers, container_id, workspaces, workspace_id = (
+            path.split("/")
+        )
+        if (accounts, containers, workspaces) != ("accounts", "containers", "workspaces"):
+            raise ValueError("Invalid path segments")
 
         return {
-            "account_id": parts[1],
-            "container_id": parts[3],
-            "workspace_id": parts[5]
+            "account_id": account_id,
+            "container_id": container_id,
+            "workspace_id": workspace_id
         }
-    except (ValueError, IndexError) as e:
+    except ValueError:
         raise ParameterFormatError(
             "Invalid workspace path format",
             parameter_key="path",
@@ -559,27 +641,20 @@ def merge_parameters(
             {'type': 'TEMPLATE', 'key': 'key2', 'value': 'value2'}
         ]
     """
-    merged: Dict[str, Dict[str, Any]] = {}
+    keyed: Dict[str, Dict[str, Any]] = {}
+    # Parameters without keys (like trigger references) are always added,
+    # after the keyed ones
+    keyless: List[Dict[str, Any]] = []
 
     for param_list in param_lists:
         for param in param_list:
             key = param.get("key")
             if key:
-                merged[key] = param
+                keyed[key] = param
             else:
-                # Parameters without keys (like trigger references) are always added
-                # Use a unique identifier to prevent overwrites
-                unique_key = f"_no_key_{id(param)}"
-                merged[unique_key] = param
+                keyless.append(param)
 
-    # Filter out the temporary keys we added
-    return [
-        param for key, param in merged.items()
-        if not key.startswith("_no_key_")
-    ] + [
-        param for key, param in merged.items()
-        if key.startswith("_no_key_")
-    ]
+    return [*keyed.values(), *keyless]
 
 
 def build_ga4_config_tag(
@@ -608,8 +683,8 @@ def build_ga4_config_tag(
         }
     """
     params = [
-        build_template_parameter("measurementId", measurement_id),
-        build_boolean_parameter("sendPageView", send_page_view)
+        {"type": _TYPE_TEMPLATE, "key": "measurementId", "value": str(measurement_id)},
+        {"type": _TYPE_BOOLEAN, "key": "sendPageView", "value": _BOOL_STR[bool(send_page_view)]}
     ]
 
     if additional_params:
@@ -655,20 +730,21 @@ def build_ga4_event_tag(
         }
     """
     params = [
-        build_tag_reference_parameter("measurementId", config_tag_name),
-        build_template_parameter("eventName", event_name)
+        {"type": _TYPE_TAG_REF, "key": "measurementId", "value": config_tag_name},
+        {"type": _TYPE_TEMPLATE, "key": "eventName", "value": str(event_name)}
     ]
 
     if event_parameters:
-        params.append(
-            build_list_parameter(
-                "eventParameters",
-                build_event_parameters_list(event_parameters)
-            )
-        )
+        params.append({
+            "type": _TYPE_LIST,
+            "key": "eventParameters",
+            "list": build_event_parameters_list(event_parameters)
+        })
 
     if send_ecommerce:
-        params.append(build_boolean_parameter("sendEcommerceData", True))
+        params.append(
+            {"type": _TYPE_BOOLEAN, "key": "sendEcommerceData", "value": "true"}
+        )
 
     return {
         "name": name,
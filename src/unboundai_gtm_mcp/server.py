@@ -1,25 +1,413 @@
 """MCP server for Google Tag Manager."""
 import asyncio
 import json
-from typing import Any, Dict, List, Optional
+import sys
+from typing import Any, Dict, List, Optional, Tuple
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # optional, and POSIX only; fall back to asyncio's loop
+    uvloop = None
+
 from .gtm_client import GTMClient
 from .tools import GTMTools
 
-# Load environment variables
-load_dotenv()
+# Trigger types accepted by the gtm_create_trigger tool
+_TRIGGER_TYPE_ENUM = (
+    "pageview", "domReady", "windowLoaded", "customEvent",
+    "triggerGroup", "init", "consentInit", "serverPageview",
+    "always", "firebaseAppException", "firebaseAppUpdate",
+    "firebaseCampaign", "firebaseFirstOpen", "firebaseInAppPurchase",
+    "firebaseNotificationDismiss", "firebaseNotificationForeground",
+    "firebaseNotificationOpen", "firebaseNotificationReceive",
+    "firebaseOsUpdate", "firebaseSessionStart", "firebaseUserEngagement",
+    "formSubmission", "click", "linkClick", "jsError",
+    "historyChange", "timer", "ampClick", "ampTimer",
+    "ampScroll", "ampVisibility", "youTubeVideo",
+    "scrollDepth", "elementVisibility"
+)
+
+# Property schemas shared by several tools. The MCP library treats tool
+# schemas as read-only, so the same dict can back every tool that uses it.
+_CONTAINER_PATH_PROP = {"type": "string", "description": "Full container path (e.g., accounts/123/containers/456)"}
+_TAG_PATH_PROP = {"type": "string", "description": "Full tag path (e.g., accounts/123/containers/456/workspaces/7/tags/8)"}
+_VERSION_PATH_PROP = {"type": "string", "description": "Full version path (e.g., accounts/123/containers/456/versions/7)"}
+_WORKSPACE_PATH_PROP = {"type": "string", "description": "Full workspace path"}
+
+# Static tool definitions returned by list_tools, built once at import
+_TOOL_DEFINITIONS: Tuple[Tool, ...] = (
+    Tool(
+        name="gtm_list_accounts",
+        description="List all accessible GTM accounts",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="gtm_list_containers",
+        description="List all containers in a GTM account",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "account_id": {
+                    "type": "string",
+                    "description": "GTM Account ID"
+                }
+            },
+            "required": ["account_id"]
+        }
+    ),
+    Tool(
+        name="gtm_list_tags",
+        description="List all tags in a container workspace",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "container_path": _CONTAINER_PATH_PROP,
+                "workspace_id": {
+                    "type": "string",
+                    "description": "Workspace ID (optional, uses default if not provided)"
+                }
+            },
+            "required": ["container_path"]
+        }
+    ),
+    Tool(
+        name="gtm_get_tag",
+        description="Get detailed configuration of a specific tag",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tag_path": _TAG_PATH_PROP
+            },
+            "required": ["tag_path"]
+        }
+    ),
+    Tool(
+        name="gtm_create_tag",
+        description="Create a new tag in a GTM container",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "workspace_path": _WORKSPACE_PATH_PROP,
+                "tag_name": {
+                    "type": "string",
+                    "description": "Name for the new tag"
+                },
+                "tag_type": {
+                    "type": "string",
+                    "description": "Type of tag (e.g., 'ua', 'ga4', 'html')"
+                },
+                "tag_config": {
+                    "type": "object",
+                    "description": "Tag configuration parameters"
+                },
+                "firing_trigger_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of trigger IDs that should fire this tag"
+                }
+            },
+            "required": ["workspace_path", "tag_name", "tag_type"]
+        }
+    ),
+    Tool(
+        name="gtm_update_tag",
+        description="Update an existing tag in a GTM container",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tag_path": _TAG_PATH_PROP,
+                "tag_data": {
+                    "type": "object",
+                    "description": "Complete tag data object to update"
+                }
+            },
+            "required": ["tag_path", "tag_data"]
+        }
+    ),
+    Tool(
+        name="gtm_list_triggers",
+        description="List all triggers in a container workspace",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "workspace_path": _WORKSPACE_PATH_PROP
+            },
+            "required": ["workspace_path"]
+        }
+    ),
+    Tool(
+        name="gtm_create_trigger",
+        description="Create a new trigger in a GTM container. For Custom Event triggers, use custom_event_name parameter for simplified creation.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "workspace_path": _WORKSPACE_PATH_PROP,
+                "trigger_name": {
+                    "type": "string",
+                    "description": "Name for the new trigger"
+                },
+                "trigger_type": {
+                    "type": "string",
+                    "description": "Type of trigger",
+                    "enum": list(_TRIGGER_TYPE_ENUM)
+                },
+                "custom_event_name": {
+                    "type": "string",
+                    "description": "For Custom Event triggers: the event name to match (e.g., 'purchase', 'add_to_cart'). This automatically generates the customEventFilter."
+                },
+                "trigger_config": {
+                    "type": "object",
+                    "description": "Trigger configuration parameters (optional if using custom_event_name)"
+                }
+            },
+            "required": ["workspace_path", "trigger_name", "trigger_type"]
+        }
+    ),
+    Tool(
+        name="gtm_list_variables",
+        description="List all variables in a container workspace",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "workspace_path": _WORKSPACE_PATH_PROP
+            },
+            "required": ["workspace_path"]
+        }
+    ),
+    Tool(
+        name="gtm_get_variable",
+        description="Get detailed configuration of a specific variable",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "variable_path": {
+                    "type": "string",
+                    "description": "Full variable path (e.g., accounts/123/containers/456/workspaces/7/variables/8)"
+                }
+            },
+            "required": ["variable_path"]
+        }
+    ),
+    Tool(
+        name="gtm_create_variable",
+        description="Create a new variable in a GTM container",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "workspace_path": _WORKSPACE_PATH_PROP,
+                "variable_name": {
+                    "type": "string",
+                    "description": "Name for the new variable"
+                },
+                "variable_type": {
+                    "type": "string",
+                    "description": "Type of variable. Common types: 'c' (constant), 'v' (data layer variable), 'jsm' (javascript variable), 'u' (URL variable), 'k' (cookie)"
+                },
+                "variable_config": {
+                    "type": "object",
+                    "description": "Variable configuration. For constant: {value: 'string'}, for data layer: {data_layer_name: 'name'}, for cookie: {cookie_name: 'name'}, etc."
+                }
+            },
+            "required": ["workspace_path", "variable_name", "variable_type"]
+        }
+    ),
+    Tool(
+        name="gtm_publish_container",
+        description="Create and publish a new version of a GTM container",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "workspace_path": _WORKSPACE_PATH_PROP,
+                "version_name": {
+                    "type": "string",
+                    "description": "Name for the new version"
+                },
+                "version_notes": {
+                    "type": "string",
+                    "description": "Notes describing changes in this version"
+                }
+            },
+            "required": ["workspace_path", "version_name"]
+        }
+    ),
+    Tool(
+        name="gtm_list_versions",
+        description="List all versions of a GTM container",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "container_path": _CONTAINER_PATH_PROP,
+                "include_deleted": {
+                    "type": "boolean",
+                    "description": "Whether to include deleted (archived) versions. Default: false"
+                }
+            },
+            "required": ["container_path"]
+        }
+    ),
+    Tool(
+        name="gtm_get_version",
+        description="Get detailed information about a specific container version",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "version_path": _VERSION_PATH_PROP
+            },
+            "required": ["version_path"]
+        }
+    ),
+    Tool(
+        name="gtm_get_live_version",
+        description="Get the currently published (live) version of a container",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "container_path": _CONTAINER_PATH_PROP
+            },
+            "required": ["container_path"]
+        }
+    ),
+    Tool(
+        name="gtm_get_latest_version",
+        description="Get the latest version of a container (may not be published)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "container_path": _CONTAINER_PATH_PROP
+            },
+            "required": ["container_path"]
+        }
+    ),
+    Tool(
+        name="gtm_delete_version",
+        description="Delete (archive) a container version. The version can be restored later.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "version_path": _VERSION_PATH_PROP
+            },
+            "required": ["version_path"]
+        }
+    ),
+    Tool(
+        name="gtm_undelete_version",
+        description="Restore a previously deleted (archived) container version",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "version_path": _VERSION_PATH_PROP
+            },
+            "required": ["version_path"]
+        }
+    ),
+    Tool(
+        name="gtm_update_version",
+        description="Update metadata of a container version (name, description, notes)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "version_path": _VERSION_PATH_PROP,
+                "version_data": {
+                    "type": "object",
+                    "description": "Version data to update. Can include: name, description, notes, fingerprint"
+                }
+            },
+            "required": ["version_path", "version_data"]
+        }
+    ),
+    Tool(
+        name="gtm_set_latest_version",
+        description="Mark a container version as the latest version",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "version_path": _VERSION_PATH_PROP
+            },
+            "required": ["version_path"]
+        }
+    ),
+    Tool(
+        name="gtm_batch_execute",
+        description="Run several GTM tool calls in one request, one after another. Returns one result or error per operation, in order.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "operations": {
+                    "type": "array",
+                    "description": "Tool calls to run",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {
+                                "type": "string",
+                                "description": "Tool name (e.g., 'gtm_get_tag')"
+                            },
+                            "arguments": {
+                                "type": "object",
+                                "description": "Arguments for the tool"
+                            }
+                        },
+                        "required": ["name"]
+                    }
+                },
+                "stop_on_error": {
+                    "type": "boolean",
+                    "description": "Skip the remaining operations once one fails. Default: false"
+                }
+            },
+            "required": ["operations"]
+        }
+    )
+)
+
+
+def _dumps(result: Any) -> str:
+    """Serialize a tool result as compact JSON, using orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # e.g. integers beyond 64 bits, which the stdlib encoder handles
+            pass
+    # ensure_ascii=False keeps non-ASCII text unescaped, as orjson emits it
+    return json.dumps(result, separators=(",", ":"), ensure_ascii=False)
+
+
+# One GTM client shared by every server instance in the process
+_client: Optional[GTMClient] = None
+_client_lock = asyncio.Lock()
+
+
+async def get_client() -> GTMClient:
+    """Return the shared GTM client, creating it on first use."""
+    global _client
+    if _client is None:
+        async with _client_lock:
+            if _client is None:
+                _client = await asyncio.to_thread(GTMClient)
+    return _client
+
 
 class GTMMCPServer:
     """MCP Server for Google Tag Manager operations."""
-    """MCP Server for Google Tag Manager operations."""
+
+    __slots__ = ("server", "tools")
 
     def __init__(self):
         self.server = Server("gtm-mcp")
-        self.gtm_client = None
         self.tools = GTMTools()
         self._setup_handlers()
 
@@ -29,375 +417,17 @@ class GTMMCPServer:
         @self.server.list_tools()
         async def handle_list_tools() -> List[Tool]:
             """Return list of available GTM tools."""
-            return [
-                Tool(
-                    name="gtm_list_accounts",
-                    description="List all accessible GTM accounts",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                ),
-                Tool(
-                    name="gtm_list_containers",
-                    description="List all containers in a GTM account",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "account_id": {
-                                "type": "string",
-                                "description": "GTM Account ID"
-                            }
-                        },
-                        "required": ["account_id"]
-                    }
-                ),
-                Tool(
-                    name="gtm_list_tags",
-                    description="List all tags in a container workspace",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "container_path": {
-                                "type": "string",
-                                "description": "Full container path (e.g., accounts/123/containers/456)"
-                            },
-                            "workspace_id": {
-                                "type": "string",
-                                "description": "Workspace ID (optional, uses default if not provided)"
-                            }
-                        },
-                        "required": ["container_path"]
-                    }
-                ),
-                Tool(
-                    name="gtm_get_tag",
-                    description="Get detailed configuration of a specific tag",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "tag_path": {
-                                "type": "string",
-                                "description": "Full tag path (e.g., accounts/123/containers/456/workspaces/7/tags/8)"
-                            }
-                        },
-                        "required": ["tag_path"]
-                    }
-                ),
-                Tool(
-                    name="gtm_create_tag",
-                    description="Create a new tag in a GTM container",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "workspace_path": {
-                                "type": "string",
-                                "description": "Full workspace path"
-                            },
-                            "tag_name": {
-                                "type": "string",
-                                "description": "Name for the new tag"
-                            },
-                            "tag_type": {
-                                "type": "string",
-                                "description": "Type of tag (e.g., 'ua', 'ga4', 'html')"
-                            },
-                            "tag_config": {
-                                "type": "object",
-                                "description": "Tag configuration parameters"
-                            },
-                            "firing_trigger_ids": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "List of trigger IDs that should fire this tag"
-                            }
-                        },
-                        "required": ["workspace_path", "tag_name", "tag_type"]
-                    }
-                ),
-                Tool(
-                    name="gtm_update_tag",
-                    description="Update an existing tag in a GTM container",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "tag_path": {
-                                "type": "string",
-                                "description": "Full tag path (e.g., accounts/123/containers/456/workspaces/7/tags/8)"
-                            },
-                            "tag_data": {
-                                "type": "object",
-                                "description": "Complete tag data object to update"
-                            }
-                        },
-                        "required": ["tag_path", "tag_data"]
-                    }
-                ),
-                Tool(
-                    name="gtm_list_triggers",
-                    description="List all triggers in a container workspace",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "workspace_path": {
-                                "type": "string",
-                                "description": "Full workspace path"
-                            }
-                        },
-                        "required": ["workspace_path"]
-                    }
-                ),
-                Tool(
-                    name="gtm_create_trigger",
-                    description="Create a new trigger in a GTM container. For Custom Event triggers, use custom_event_name parameter for simplified creation.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "workspace_path": {
-                                "type": "string",
-                                "description": "Full workspace path"
-                            },
-                            "trigger_name": {
-                                "type": "string",
-                                "description": "Name for the new trigger"
-                            },
-                            "trigger_type": {
-                                "type": "string",
-                                "description": "Type of trigger",
-                                "enum": [
-                                    "pageview", "domReady", "windowLoaded", "customEvent",
-                                    "triggerGroup", "init", "consentInit", "serverPageview",
-                                    "always", "firebaseAppException", "firebaseAppUpdate",
-                                    "firebaseCampaign", "firebaseFirstOpen", "firebaseInAppPurchase",
-                                    "firebaseNotificationDismiss", "firebaseNotificationForeground",
-                                    "firebaseNotificationOpen", "firebaseNotificationReceive",
-                                    "firebaseOsUpdate", "firebaseSessionStart", "firebaseUserEngagement",
-                                    "formSubmission", "click", "linkClick", "jsError",
-                                    "historyChange", "timer", "ampClick", "ampTimer",
-                                    "ampScroll", "ampVisibility", "youTubeVideo",
-                                    "scrollDepth", "elementVisibility"
-                                ]
-                            },
-                            "custom_event_name": {
-                                "type": "string",
-                                "description": "For Custom Event triggers: the event name to match (e.g., 'purchase', 'add_to_cart'). This automatically generates the customEventFilter."
-                            },
-                            "trigger_config": {
-                                "type": "object",
-                                "description": "Trigger configuration parameters (optional if using custom_event_name)"
-                            }
-                        },
-                        "required": ["workspace_path", "trigger_name", "trigger_type"]
-                    }
-                ),
-                Tool(
-                    name="gtm_list_variables",
-                    description="List all variables in a container workspace",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "workspace_path": {
-                                "type": "string",
-                                "description": "Full workspace path"
-                            }
-                        },
-                        "required": ["workspace_path"]
-                    }
-                ),
-                Tool(
-                    name="gtm_get_variable",
-                    description="Get detailed configuration of a specific variable",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "variable_path": {
-                                "type": "string",
-                                "description": "Full variable path (e.g., accounts/123/containers/456/workspaces/7/variables/8)"
-                            }
-                        },
-                        "required": ["variable_path"]
-                    }
-                ),
-                Tool(
-                    name="gtm_create_variable",
-                    description="Create a new variable in a GTM container",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "workspace_path": {
-                                "type": "string",
-                                "description": "Full workspace path"
-                            },
-                            "variable_name": {
-                                "type": "string",
-                                "description": "Name for the new variable"
-                            },
-                            "variable_type": {
-                                "type": "string",
-                                "description": "Type of variable. Common types: 'c' (constant), 'v' (data layer variable), 'jsm' (javascript variable), 'u' (URL variable), 'k' (cookie)"
-                            },
-                            "variable_config": {
-                                "type": "object",
-                                "description": "Variable configuration. For constant: {value: 'string'}, for data layer: {data_layer_name: 'name'}, for cookie: {cookie_name: 'name'}, etc."
-                            }
-                        },
-                        "required": ["workspace_path", "variable_name", "variable_type"]
-                    }
-                ),
-                Tool(
-                    name="gtm_publish_container",
-                    description="Create and publish a new version of a GTM container",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "workspace_path": {
-                                "type": "string",
-                                "description": "Full workspace path"
-                            },
-                            "version_name": {
-                                "type": "string",
-                                "description": "Name for the new version"
-                            },
-                            "version_notes": {
-                                "type": "string",
-                                "description": "Notes describing changes in this version"
-                            }
-                        },
-                        "required": ["workspace_path", "version_name"]
-                    }
-                ),
-                Tool(
-                    name="gtm_list_versions",
-                    description="List all versions of a GTM container",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "container_path": {
-                                "type": "string",
-                                "description": "Full container path (e.g., accounts/123/containers/456)"
-                            },
-                            "include_deleted": {
-                                "type": "boolean",
-                                "description": "Whether to include deleted (archived) versions. Default: false"
-                            }
-                        },
-                        "required": ["container_path"]
-                    }
-                ),
-                Tool(
-                    name="gtm_get_version",
-                    description="Get detailed information about a specific container version",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "version_path": {
-                                "type": "string",
-                                "description": "Full version path (e.g., accounts/123/containers/456/versions/7)"
-                            }
-                        },
-                        "required": ["version_path"]
-                    }
-                ),
-                Tool(
-                    name="gtm_get_live_version",
-                    description="Get the currently published (live) version of a container",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "container_path": {
-                                "type": "string",
-                                "description": "Full container path (e.g., accounts/123/containers/456)"
-                            }
-                        },
-                        "required": ["container_path"]
-                    }
-                ),
-                Tool(
-                    name="gtm_get_latest_version",
-                    description="Get the latest version of a container (may not be published)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "container_path": {
-                                "type": "string",
-                                "description": "Full container path (e.g., accounts/123/containers/456)"
-                            }
-                        },
-                        "required": ["container_path"]
-                    }
-                ),
-                Tool(
-                    name="gtm_delete_version",
-                    description="Delete (archive) a container version. The version can be restored later.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "version_path": {
-                                "type": "string",
-                                "description": "Full version path (e.g., accounts/123/containers/456/versions/7)"
-                            }
-                        },
-                        "required": ["version_path"]
-                    }
-                ),
-                Tool(
-                    name="gtm_undelete_version",
-                    description="Restore a previously deleted (archived) container version",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "version_path": {
-                                "type": "string",
-                                "description": "Full version path (e.g., accounts/123/containers/456/versions/7)"
-                            }
-                        },
-                        "required": ["version_path"]
-                    }
-                ),
-                Tool(
-                    name="gtm_update_version",
-                    description="Update metadata of a container version (name, description, notes)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "version_path": {
-                                "type": "string",
-                                "description": "Full version path (e.g., accounts/123/containers/456/versions/7)"
-                            },
-                            "version_data": {
-                                "type": "object",
-                                "description": "Version data to update. Can include: name, description, notes, fingerprint"
-                            }
-                        },
-                        "required": ["version_path", "version_data"]
-                    }
-                ),
-                Tool(
-                    name="gtm_set_latest_version",
-                    description="Mark a container version as the latest version",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "version_path": {
-                                "type": "string",
-                                "description": "Full version path (e.g., accounts/123/containers/456/versions/7)"
-                            }
-                        },
-                        "required": ["version_path"]
-                    }
-                )
-            ]
+            return list(_TOOL_DEFINITIONS)
 
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: Optional[Dict[str, Any]]) -> List[TextContent]:
             """Handle tool execution."""
-            if not self.gtm_client:
-                self.gtm_client = GTMClient()
-
             try:
-                result = await self.tools.execute_tool(name, arguments, self.gtm_client)
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
+                # Retries authentication if it failed at startup, so the
+                # caller sees why
+                client = await get_client()
+                result = await self.tools.execute_tool(name, arguments, client)
+                return [TextContent(type="text", text=_dumps(result))]
             except Exception as e:
                 return [TextContent(type="text", text=f"Error executing tool: {str(e)}")]
 
@@ -405,6 +435,13 @@ async def main():
     """Main entry point."""
     server_instance = GTMMCPServer()
 
+    # Authenticate before serving so the first tool call doesn't pay for it.
+    # A failure is reported on stderr; tool calls then retry and return the error.
+    try:
+        await get_client()
+    except Exception as e:
+        print(f"GTM client initialization failed: {e}", file=sys.stderr)
+
     async with stdio_server() as (read_stream, write_stream):
         await server_instance.server.run(
             read_stream,
@@ -413,6 +450,22 @@ async def main():
         )
 
 def run():
+    # Load environment variables; done here rather than at import so that
+    # importing the module (e.g. from tests) doesn't read .env files
+    load_dotenv()
+
+    # The default Proactor loop on Windows polls while idle; stdio works fine
+    # on the selector loop
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    elif uvloop is not None:
+        # uvloop.run() was added in uvloop 0.18; older releases only offer
+        # the event loop policy
+        uvloop_run = getattr(uvloop, "run", None)
+        if uvloop_run is not None:
+            uvloop_run(main())
+            return
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main())
 
 if __name__ == "__main__":
@@ -0,0 +1,30 @@
+"""Shared pytest fixtures for GTM tests."""
+
+from unittest.mock import create_autospec
+
+import pytest
+
+from unboundai_gtm_mcp.gtm_client import GTMClient
+from unboundai_gtm_mcp.tools import GTMTools
+
+
+@pytest.fixture(scope="session")
+def ecom_params():
+    """Provide GA4 ecommerce event parameters in the simplified format."""
+    return [
+        {"name": "currency", "value": "DKK"},
+        {"name": "value", "value": "{{Transaction Value}}"},
+    ]
+
+
+@pytest.fixture
+def tools():
+    """Provide a fresh GTMTools instance, so no account cache carries over."""
+    return GTMTools()
+
+
+@pytest.fixture
+def mock_client():
+    """Provide a fresh mock GTM client autospecced from GTMClient."""
+    return create_autospec(GTMClient, instance=True, spec_set=True)
+
@@ -2,8 +2,7 @@
 
 import os
 import pytest
-from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import patch, MagicMock
 from unboundai_gtm_mcp.utils import GTMAuth
 
 
@@ -32,7 +31,7 @@ class TestGTMAuth:
         assert auth.scopes == mock_scopes
 
     @patch('unboundai_gtm_mcp.utils.google.auth.default')
-    @patch('unboundai_gtm_mcp.utils.build')
+    @patch('googleapiclient.discovery.build')
     def test_authenticate_success(
         self, mock_build, mock_default_auth, mock_token_file, mock_scopes, tmp_path
     ):
@@ -64,6 +63,30 @@ class TestGTMAuth:
             mock_build.assert_called_once_with("tagmanager", "v2", credentials=mock_credentials)
             assert service == mock_service
 
+    @patch('unboundai_gtm_mcp.utils.google.auth.default')
+    @patch('googleapiclient.discovery.build')
+    def test_authenticate_reuses_credentials(
+        self, mock_build, mock_default_auth, mock_token_file, mock_scopes, tmp_path
+    ):
+        """Test that credentials are loaded once and kept in memory."""
+        sa_file = tmp_path / "service-account.json"
+        sa_file.write_text('{"type": "service_account"}')
+
+        mock_credentials = MagicMock()
+        mock_default_auth.return_value = (mock_credentials, "test-project")
+
+        with patch.dict(os.environ, {
+            "GOOGLE_APPLICATION_CREDENTIALS": str(sa_file),
+            "GOOGLE_PROJECT_ID": "test-project"
+        }):
+            auth = GTMAuth(mock_token_file, "tagmanager", "v2", mock_scopes)
+            auth.authenticate()
+            auth.authenticate()
+
+            mock_default_auth.assert_called_once_with(scopes=mock_scopes)
+            assert auth.credentials is mock_credentials
+            assert mock_build.call_count == 2
+
     def test_authenticate_missing_credentials_env_var(self, mock_token_file, mock_scopes):
         """Test authentication fails when GOOGLE_APPLICATION_CREDENTIALS is not set."""
         with patch.dict(os.environ, {
@@ -121,7 +144,7 @@ class TestGTMAuth:
                 auth.authenticate()
 
     @patch('unboundai_gtm_mcp.utils.google.auth.default')
-    @patch('unboundai_gtm_mcp.utils.build')
+    @patch('googleapiclient.discovery.build')
     def test_create_credentials(self, mock_build, mock_default_auth, mock_token_file, mock_scopes, tmp_path):
         """Test _create_credentials method."""
         sa_file = tmp_path / "service-account.json"
@@ -13,6 +13,24 @@ from unboundai_gtm_mcp.exceptions import (
 )
 
 
+class TestInheritance:
+    """Test the exception class hierarchy."""
+
+    @pytest.mark.parametrize("error", [
+        GTMError("Test"),
+        ValidationError("Test"),
+        APIError("Test"),
+        ResourceNotFoundError("tag", "1"),
+        PermissionError("Test"),
+        ConfigurationError("Test"),
+        ParameterFormatError("Test"),
+    ], ids=lambda error: type(error).__name__)
+    def test_inherits_from_gtm_error(self, error):
+        """Test that every GTM exception is a GTMError and an Exception."""
+        assert isinstance(error, GTMError)
+        assert isinstance(error, Exception)
+
+
 class TestGTMError:
     """Test GTMError base exception."""
 
@@ -32,11 +50,6 @@ class TestGTMError:
         assert "Details:" in str(error)
         assert "key" in str(error)
 
-    def test_error_inheritance(self):
-        """Test that GTMError inherits from Exception."""
-        error = GTMError("Test")
-        assert isinstance(error, Exception)
-
 
 class TestValidationError:
     """Test ValidationError exception."""
@@ -70,12 +83,6 @@ class TestValidationError:
         assert error.details["value"] == "abc"
         assert error.details["expected"] == "integer"
 
-    def test_validation_error_inheritance(self):
-        """Test that ValidationError inherits from GTMError."""
-        error = ValidationError("Test")
-        assert isinstance(error, GTMError)
-        assert isinstance(error, Exception)
-
 
 class TestAPIError:
     """Test APIError exception."""
@@ -18,6 +18,7 @@ from unboundai_gtm_mcp.helpers import (
     build_scroll_percentage_list,
     build_tag_reference_parameter,
     build_template_parameter,
+    build_template_parameters,
     build_trigger_reference_parameter,
     build_url_filter,
     build_workspace_path,
@@ -27,71 +28,53 @@ from unboundai_gtm_mcp.helpers import (
 )
 
 
-class TestBuildTemplateParameter:
-    """Test build_template_parameter function."""
-
-    def test_build_simple_template(self):
-        """Test building simple template parameter."""
-        result = build_template_parameter("key1", "value1")
-        assert result == {
-            "type": "TEMPLATE",
-            "key": "key1",
-            "value": "value1"
-        }
-
-    def test_build_template_with_variable_reference(self):
-        """Test building template with variable reference."""
-        result = build_template_parameter("eventName", "{{Event Name}}")
-        assert result == {
-            "type": "TEMPLATE",
-            "key": "eventName",
-            "value": "{{Event Name}}"
-        }
-
-    def test_build_template_converts_to_string(self):
-        """Test that value is converted to string."""
-        result = build_template_parameter("count", 42)
-        assert result["value"] == "42"
-
-
-class TestBuildBooleanParameter:
-    """Test build_boolean_parameter function."""
-
-    def test_build_true_boolean(self):
-        """Test building boolean parameter with True value."""
-        result = build_boolean_parameter("sendPageView", True)
-        assert result == {
-            "type": "BOOLEAN",
-            "key": "sendPageView",
-            "value": "true"
-        }
-
-    def test_build_false_boolean(self):
-        """Test building boolean parameter with False value."""
-        result = build_boolean_parameter("sendPageView", False)
-        assert result == {
-            "type": "BOOLEAN",
-            "key": "sendPageView",
-            "value": "false"
-        }
-
-
-class TestBuildIntegerParameter:
-    """Test build_integer_parameter function."""
-
-    def test_build_integer_parameter(self):
-        """Test building integer parameter."""
-        result = build_integer_parameter("dataLayerVersion", 2)
-        assert result == {
-            "type": "INTEGER",
-            "key": "dataLayerVersion",
-            "value": "2"
-        }
-
-    def test_build_integer_parameter_large_value(self):
-        """Test building integer parameter with large value."""
-        result = build_integer_parameter("timeout", 30000)
-        assert result["value"] == "30000"
+def by_key(params):
+    """Index a GTM parameter list by key, skipping keyless entries."""
+    return {p["key"]: p for p in params if "key" in p}
+
+
+class TestBuildScalarParameters:
+    """Test the single-value parameter builders."""
+
+    @pytest.mark.parametrize("builder,args,expected", [
+        (build_template_parameter, ("key1", "value1"),
+         {"type": "TEMPLATE", "key": "key1", "value": "value1"}),
+        (build_template_parameter, ("eventName", "{{Event Name}}"),
+         {"type": "TEMPLATE", "key": "eventName", "value": "{{Event Name}}"}),
+        (build_template_parameter, ("count", 42),
+         {"type": "TEMPLATE", "key": "count", "value": "42"}),
+        (build_boolean_parameter, ("sendPageView", True),
+         {"type": "BOOLEAN", "key": "sendPageView", "value": "true"}),
+        (build_boolean_parameter, ("sendPageView", False),
+         {"type": "BOOLEAN", "key": "sendPageView", "value": "false"}),
+        (build_integer_parameter, ("dataLayerVersion", 2),
+         {"type": "INTEGER", "key": "dataLayerVersion", "value": "2"}),
+        (build_integer_parameter, ("timeout", 30000),
+         {"type": "INTEGER", "key": "timeout", "value": "30000"}),
+        (build_tag_reference_parameter, ("measurementId", "GA4 - Config"),
+         {"type": "TAG_REFERENCE", "key": "measurementId", "value": "GA4 - Config"}),
+        (build_trigger_reference_parameter, ("12345",),
+         {"type": "TRIGGER_REFERENCE", "value": "12345"}),
+        (build_trigger_reference_parameter, (12345,),
+         {"type": "TRIGGER_REFERENCE", "value": "12345"}),
+    ])
+    def test_build_parameter(self, builder, args, expected):
+        """Test that the builder produces the expected GTM parameter."""
+        assert builder(*args) == expected
+
+
+class TestBuildTemplateParameters:
+    """Test build_template_parameters function."""
+
+    def test_matches_single_builder(self):
+        """Test that bulk building matches build_template_parameter."""
+        pairs = [("name", "currency"), ("value", "DKK"), ("count", 3)]
+        result = build_template_parameters(pairs)
+        assert result == [build_template_parameter(k, v) for k, v in pairs]
+
+    def test_empty_pairs(self):
+        """Test building from no pairs."""
+        assert build_template_parameters([]) == []
 
 
 class TestBuildListParameter:
@@ -128,36 +111,6 @@ class TestBuildMapParameter:
         assert len(result["map"]) == 2
 
 
-class TestBuildTagReferenceParameter:
-    """Test build_tag_reference_parameter function."""
-
-    def test_build_tag_reference(self):
-        """Test building tag reference parameter."""
-        result = build_tag_reference_parameter("measurementId", "GA4 - Config")
-        assert result == {
-            "type": "TAG_REFERENCE",
-            "key": "measurementId",
-            "value": "GA4 - Config"
-        }
-
-
-class TestBuildTriggerReferenceParameter:
-    """Test build_trigger_reference_parameter function."""
-
-    def test_build_trigger_reference(self):
-        """Test building trigger reference parameter."""
-        result = build_trigger_reference_parameter("12345")
-        assert result == {
-            "type": "TRIGGER_REFERENCE",
-            "value": "12345"
-        }
-
-    def test_build_trigger_reference_converts_to_string(self):
-        """Test that trigger ID is converted to string."""
-        result = build_trigger_reference_parameter(12345)
-        assert result["value"] == "12345"
-
-
 class TestBuildEventParameter:
     """Test build_event_parameter function."""
 
@@ -180,13 +133,9 @@ class TestBuildEventParameter:
 class TestBuildEventParametersList:
     """Test build_event_parameters_list function."""
 
-    def test_build_event_parameters_list(self):
+    def test_build_event_parameters_list(self, ecom_params):
         """Test building list of event parameters."""
-        params = [
-            {"name": "currency", "value": "DKK"},
-            {"name": "value", "value": "100"}
-        ]
-        result = build_event_parameters_list(params)
+        result = build_event_parameters_list(ecom_params)
         assert len(result) == 2
         assert result[0]["type"] == "MAP"
         assert result[0]["map"][0]["value"] == "currency"
@@ -217,6 +166,18 @@ class TestBuildScrollPercentageList:
         assert len(result["list"]) == 1
         assert result["list"][0]["value"] == "100"
 
+    def test_build_scroll_percentage_list_returns_fresh_structure(self):
+        """Test that repeated calls do not share mutable state."""
+        first = build_scroll_percentage_list([25, 50])
+        first["list"][0]["value"] = "changed"
+        first["list"].append({"type": "TEMPLATE", "value": "99"})
+
+        second = build_scroll_percentage_list((25, 50))
+        assert second["list"] == [
+            {"type": "TEMPLATE", "value": "25"},
+            {"type": "TEMPLATE", "value": "50"},
+        ]
+
 
 class TestBuildCustomEventFilter:
     """Test build_custom_event_filter function."""
@@ -253,6 +214,11 @@ class TestBuildUrlFilter:
         result = build_url_filter("{{Page Path}}", "EQUALS", "/thank-you")
         assert result[0]["type"] == "EQUALS"
 
+    def test_build_url_filter_non_string_pattern(self):
+        """Test that a non-string pattern is coerced to a string value."""
+        result = build_url_filter("{{Page Path}}", "GREATER_THAN", 100)
+        assert result[0]["parameter"][1]["value"] == "100"
+
 
 class TestBuildClickFilter:
     """Test build_click_filter function."""
@@ -263,6 +229,11 @@ class TestBuildClickFilter:
         assert result[0]["parameter"][0]["value"] == "{{Click URL}}"
         assert result[0]["parameter"][1]["value"] == "tel:"
 
+    def test_build_click_filter_non_string_pattern(self):
+        """Test that a non-string pattern is coerced to a string value."""
+        result = build_click_filter("EQUALS", 42, click_property="{{Click ID}}")
+        assert result[0]["parameter"][1]["value"] == "42"
+
     def test_build_click_filter_custom_property(self):
         """Test building click filter with custom click property."""
         result = build_click_filter(
@@ -273,60 +244,49 @@ class TestBuildClickFilter:
         assert result[0]["parameter"][0]["value"] == "{{Click Text}}"
 
 
-class TestBuildWorkspacePath:
-    """Test build_workspace_path function."""
+class TestBuildPaths:
+    """Test build_workspace_path and build_container_path functions."""
 
-    def test_build_workspace_path(self):
-        """Test building workspace path from components."""
-        result = build_workspace_path("123456", "789012", "5")
-        assert result == "accounts/123456/containers/789012/workspaces/5"
+    @pytest.mark.parametrize("builder,args,expected", [
+        (build_workspace_path, ("123456", "789012", "5"),
+         "accounts/123456/containers/789012/workspaces/5"),
+        (build_workspace_path, ("6321366409", "233765626", "1"),
+         "accounts/6321366409/containers/233765626/workspaces/1"),
+        (build_container_path, ("123456", "789012"),
+         "accounts/123456/containers/789012"),
+    ])
+    def test_build_path(self, builder, args, expected):
+        """Test building a resource path from its components."""
+        assert builder(*args) == expected
 
-    def test_build_workspace_path_default_workspace(self):
-        """Test building path for default workspace."""
-        result = build_workspace_path("6321366409", "233765626", "1")
-        assert result == "accounts/6321366409/containers/233765626/workspaces/1"
 
+# (path, resource_type, expected ID) cases for extract_id_from_path
+EXTRACT_ID_CASES = (
+    ("accounts/123456/containers/789012", "container", "789012"),
+    ("accounts/123456/containers/789012/workspaces/5", "workspace", "5"),
+    ("accounts/123/containers/456/workspaces/1/tags/789", "tag", "789"),
+)
 
-class TestBuildContainerPath:
-    """Test build_container_path function."""
-
-    def test_build_container_path(self):
-        """Test building container path from components."""
-        result = build_container_path("123456", "789012")
-        assert result == "accounts/123456/containers/789012"
+# (path, resource_type) cases that extract_id_from_path must reject
+EXTRACT_ID_ERROR_CASES = (
+    ("accounts/123", "container"),
+    ("accounts/123/containers/456", "workspace"),
+)
 
 
 class TestExtractIdFromPath:
     """Test extract_id_from_path function."""
 
-    def test_extract_container_id(self):
-        """Test extracting container ID from path."""
-        path = "accounts/123456/containers/789012"
-        result = extract_id_from_path(path, "container")
-        assert result == "789012"
-
-    def test_extract_workspace_id(self):
-        """Test extracting workspace ID from path."""
-        path = "accounts/123456/containers/789012/workspaces/5"
-        result = extract_id_from_path(path, "workspace")
-        assert result == "5"
-
-    def test_extract_tag_id(self):
-        """Test extracting tag ID from path."""
-        path = "accounts/123/containers/456/workspaces/1/tags/789"
-        result = extract_id_from_path(path, "tag")
-        assert result == "789"
+    @pytest.mark.parametrize("path,resource_type,expected", EXTRACT_ID_CASES)
+    def test_extract_id(self, path, resource_type, expected):
+        """Test extracting a resource ID from a path."""
+        assert extract_id_from_path(path, resource_type) == expected
 
-    def test_extract_id_invalid_path(self):
-        """Test extraction fails for invalid path."""
+    @pytest.mark.parametrize("path,resource_type", EXTRACT_ID_ERROR_CASES)
+    def test_extract_id_fails(self, path, resource_type):
+        """Test extraction fails for invalid paths or missing resource types."""
         with pytest.raises(ParameterFormatError) as exc_info:
-            extract_id_from_path("accounts/123", "container")
-        assert "Could not extract" in str(exc_info.value)
-
-    def test_extract_id_missing_resource_type(self):
-        """Test extraction fails when resource type not in path."""
-        with pytest.raises(ParameterFormatError) as exc_info:
-            extract_id_from_path("accounts/123/containers/456", "workspace")
+            extract_id_from_path(path, resource_type)
         assert "Could not extract" in str(exc_info.value)
 
 
@@ -351,17 +311,18 @@ class TestParseWorkspacePath:
         assert result["container_id"] == "233765626"
         assert result["workspace_id"] == "1"
 
-    def test_parse_invalid_workspace_path(self):
-        """Test parsing fails for invalid path."""
+    @pytest.mark.parametrize("path", [
+        "accounts/123/containers/456",
+        "invalid/path",
+        "",
+        "foo/1/bar/2/baz/3",
+    ])
+    def test_parse_workspace_path_rejects(self, path):
+        """Test parsing fails for short, malformed or wrongly named paths."""
         with pytest.raises(ParameterFormatError) as exc_info:
-            parse_workspace_path("accounts/123/containers/456")
+            parse_workspace_path(path)
         assert "Invalid workspace path format" in str(exc_info.value)
 
-    def test_parse_completely_invalid_path(self):
-        """Test parsing fails for completely invalid path."""
-        with pytest.raises(ParameterFormatError):
-            parse_workspace_path("invalid/path")
-
 
 class TestMergeParameters:
     """Test merge_parameters function."""
@@ -402,16 +363,42 @@ class TestMergeParameters:
         # Parameters without keys should all be included
         assert len(result) == 2
 
+    def test_merge_keeps_keyless_parameters_after_keyed(self):
+        """Test that keyless parameters follow keyed ones in input order."""
+        ref = build_trigger_reference_parameter("123")
+        p1 = [ref, build_template_parameter("key1", "value1")]
+        p2 = [build_template_parameter("key1", "value2")]
+        result = merge_parameters(p1, p2)
+        assert result == [p2[0], ref]
+
+
+@pytest.fixture(scope="module")
+def ga4_config_default():
+    """Provide a GA4 config tag built with default options."""
+    return build_ga4_config_tag("GA4 - Config", "G-SMVP1L4HEW")
+
+
+@pytest.fixture(scope="module")
+def ga4_event_default():
+    """Provide a GA4 event tag built with default options."""
+    return build_ga4_event_tag("GA4 - Purchase", "GA4 - Config", "purchase")
+
 
 class TestBuildGA4ConfigTag:
     """Test build_ga4_config_tag function."""
 
-    def test_build_basic_ga4_config_tag(self):
+    def test_build_basic_ga4_config_tag(self, ga4_config_default):
         """Test building basic GA4 config tag."""
-        result = build_ga4_config_tag("GA4 - Config", "G-SMVP1L4HEW")
-        assert result["name"] == "GA4 - Config"
-        assert result["type"] == "gaawc"
-        assert len(result["parameter"]) == 2
+        assert ga4_config_default["name"] == "GA4 - Config"
+        assert ga4_config_default["type"] == "gaawc"
+        assert len(ga4_config_default["parameter"]) == 2
+
+    def test_build_ga4_config_tag_defaults(self, ga4_config_default):
+        """Test the default measurement ID and page view parameters."""
+        assert ga4_config_default["parameter"] == [
+            {"type": "TEMPLATE", "key": "measurementId", "value": "G-SMVP1L4HEW"},
+            {"type": "BOOLEAN", "key": "sendPageView", "value": "true"},
+        ]
 
     def test_build_ga4_config_tag_no_page_view(self):
         """Test building GA4 config tag without page view."""
@@ -421,10 +408,7 @@ class TestBuildGA4ConfigTag:
             send_page_view=False
         )
         # Find the sendPageView parameter
-        send_pv = next(
-            p for p in result["parameter"]
-            if p.get("key") == "sendPageView"
-        )
+        send_pv = by_key(result["parameter"])["sendPageView"]
         assert send_pv["value"] == "false"
 
     def test_build_ga4_config_tag_with_additional_params(self):
@@ -436,41 +420,32 @@ class TestBuildGA4ConfigTag:
             additional_params=additional
         )
         # Should have 3 parameters: measurementId, sendPageView, customParam
-        assert len(result["parameter"]) >= 2
+        assert result["type"] == "gaawc"
+        assert len(result["parameter"]) == 3
+        custom = by_key(result["parameter"])["customParam"]
+        assert custom["value"] == "value"
 
 
 class TestBuildGA4EventTag:
     """Test build_ga4_event_tag function."""
 
-    def test_build_basic_ga4_event_tag(self):
+    def test_build_basic_ga4_event_tag(self, ga4_event_default):
         """Test building basic GA4 event tag."""
-        result = build_ga4_event_tag(
-            "GA4 - Purchase",
-            "GA4 - Config",
-            "purchase"
-        )
-        assert result["name"] == "GA4 - Purchase"
-        assert result["type"] == "gaawe"
-        assert len(result["parameter"]) == 2
+        assert ga4_event_default["name"] == "GA4 - Purchase"
+        assert ga4_event_default["type"] == "gaawe"
+        assert len(ga4_event_default["parameter"]) == 2
 
-    def test_build_ga4_event_tag_with_parameters(self):
+    def test_build_ga4_event_tag_with_parameters(self, ecom_params):
         """Test building GA4 event tag with event parameters."""
-        params = [
-            {"name": "currency", "value": "DKK"},
-            {"name": "value", "value": "{{Transaction Value}}"}
-        ]
         result = build_ga4_event_tag(
             "GA4 - Purchase",
             "GA4 - Config",
             "purchase",
-            event_parameters=params
+            event_parameters=ecom_params
         )
         # Should have measurementId, eventName, and eventParameters
         assert len(result["parameter"]) == 3
-        event_params = next(
-            p for p in result["parameter"]
-            if p.get("key") == "eventParameters"
-        )
+        event_params = by_key(result["parameter"])["eventParameters"]
         assert event_params["type"] == "LIST"
 
     def test_build_ga4_event_tag_with_ecommerce(self):
@@ -482,23 +457,21 @@ class TestBuildGA4EventTag:
             send_ecommerce=True
         )
         # Should have sendEcommerceData parameter
-        ecommerce_param = next(
-            (p for p in result["parameter"]
-             if p.get("key") == "sendEcommerceData"),
-            None
-        )
+        ecommerce_param = by_key(result["parameter"]).get("sendEcommerceData")
         assert ecommerce_param is not None
         assert ecommerce_param["value"] == "true"
 
-    def test_build_ga4_event_tag_complete(self):
+    def test_build_ga4_event_tag_complete(self, ecom_params):
         """Test building complete GA4 event tag with all options."""
-        params = [{"name": "currency", "value": "DKK"}]
         result = build_ga4_event_tag(
             "GA4 - Add to Cart",
             "GA4 - Config",
             "add_to_cart",
-            event_parameters=params,
+            event_parameters=ecom_params,
             send_ecommerce=True
         )
         assert result["name"] == "GA4 - Add to Cart"
+        assert result["type"] == "gaawe"
         assert len(result["parameter"]) == 4  # measurementId, eventName, eventParameters, sendEcommerceData
+        event_name = by_key(result["parameter"])["eventName"]
+        assert event_name["value"] == "add_to_cart"
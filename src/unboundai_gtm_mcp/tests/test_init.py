@@ -0,0 +1,26 @@
+"""Unit tests for the package-level re-exports."""
+
+import importlib
+
+import pytest
+
+import unboundai_gtm_mcp
+
+
+class TestLazyExports:
+    """Test the lazily resolved re-exports in __init__."""
+
+    @pytest.mark.parametrize("name,module_name", sorted(unboundai_gtm_mcp._LAZY_ATTRS.items()))
+    def test_export_resolves_to_submodule_attribute(self, name, module_name):
+        """Test that each re-export is the object defined in its submodule."""
+        module = importlib.import_module(f"unboundai_gtm_mcp.{module_name}")
+        assert getattr(unboundai_gtm_mcp, name) is getattr(module, name)
+
+    def test_all_matches_exports(self):
+        """Test that __all__ lists the version and every re-export."""
+        assert set(unboundai_gtm_mcp.__all__) == {"__version__", *unboundai_gtm_mcp._LAZY_ATTRS}
+
+    def test_unknown_attribute(self):
+        """Test that unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+            unboundai_gtm_mcp.missing
@@ -0,0 +1,133 @@
+"""Unit tests for the server module."""
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from unboundai_gtm_mcp import server
+
+
+class TestRun:
+    """Test event loop selection in run()."""
+
+    @pytest.fixture
+    def fake_asyncio(self, monkeypatch):
+        """Stub out dotenv, main() and the asyncio entry points used by run()."""
+        fake = MagicMock()
+        monkeypatch.setattr(server, "asyncio", fake)
+        monkeypatch.setattr(server, "load_dotenv", MagicMock())
+        monkeypatch.setattr(server, "main", MagicMock(return_value="main-coro"))
+        monkeypatch.setattr(server.sys, "platform", "linux")
+        return fake
+
+    def test_uvloop_run(self, monkeypatch, fake_asyncio):
+        """Test that uvloop.run() is used when available."""
+        uvloop = SimpleNamespace(run=MagicMock(), EventLoopPolicy=MagicMock())
+        monkeypatch.setattr(server, "uvloop", uvloop)
+
+        server.run()
+
+        uvloop.run.assert_called_once_with("main-coro")
+        fake_asyncio.run.assert_not_called()
+
+    def test_uvloop_without_run(self, monkeypatch, fake_asyncio):
+        """Test that uvloop releases before 0.18 fall back to the loop policy."""
+        uvloop = SimpleNamespace(EventLoopPolicy=MagicMock(return_value="policy"))
+        monkeypatch.setattr(server, "uvloop", uvloop)
+
+        server.run()
+
+        fake_asyncio.set_event_loop_policy.assert_called_once_with("policy")
+        fake_asyncio.run.assert_called_once_with("main-coro")
+
+    def test_without_uvloop(self, monkeypatch, fake_asyncio):
+        """Test that the stdlib loop is used when uvloop is not installed."""
+        monkeypatch.setattr(server, "uvloop", None)
+
+        server.run()
+
+        fake_asyncio.set_event_loop_policy.assert_not_called()
+        fake_asyncio.run.assert_called_once_with("main-coro")
+
+
+class TestGetClient:
+    """Test the shared GTM client in get_client()."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_client_state(self, monkeypatch):
+        """Start each test with no cached client and an unused lock."""
+        monkeypatch.setattr(server, "_client", None)
+        monkeypatch.setattr(server, "_client_lock", asyncio.Lock())
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_calls_build_one_client(self, monkeypatch):
+        """Test that concurrent first calls share a single GTMClient."""
+        def slow_client():
+            # Keep the build in progress while the other calls arrive
+            time.sleep(0.05)
+            return MagicMock()
+
+        client_cls = MagicMock(side_effect=slow_client)
+        monkeypatch.setattr(server, "GTMClient", client_cls)
+
+        clients = await asyncio.gather(*(server.get_client() for _ in range(5)))
+
+        client_cls.assert_called_once_with()
+        assert all(client is clients[0] for client in clients)
+
+    @pytest.mark.asyncio
+    async def test_failed_build_is_retried(self, monkeypatch):
+        """Test that a failed first build is not cached."""
+        client = MagicMock()
+        client_cls = MagicMock(side_effect=[RuntimeError("auth failed"), client])
+        monkeypatch.setattr(server, "GTMClient", client_cls)
+
+        with pytest.raises(RuntimeError, match="auth failed"):
+            await server.get_client()
+
+        assert await server.get_client() is client
+        assert await server.get_client() is client
+        assert client_cls.call_count == 2
+
+
+# Tool results as returned by GTMTools: nested dicts and lists of strings,
+# numbers, booleans and None, with non-ASCII names and integer keys
+TOOL_RESULTS = [
+    {"accounts": [{"accountId": "6321366409", "name": "ProSun", "path": "accounts/6321366409"}]},
+    {"tag": {"name": "GA4 - Køb", "type": "gaawe", "paused": False, "notes": None}},
+    {"results": [{"name": "gtm_get_tag", "error": "Tag not found: “CE – purchase”"}]},
+    {"counts": {1: 25, 2: 50}, "fingerprint": 1700000000000},
+]
+
+
+class TestDumps:
+    """Test tool result serialization in _dumps()."""
+
+    @staticmethod
+    def assert_matches_stdlib(result, text):
+        """Check text against the stdlib encoding of the same result."""
+        assert text == json.dumps(result, separators=(",", ":"), ensure_ascii=False)
+        # Same document as the pretty-printed output the server used to send
+        assert json.loads(text) == json.loads(json.dumps(result, indent=2))
+
+    @pytest.mark.parametrize("result", TOOL_RESULTS)
+    def test_orjson(self, result):
+        """Test the orjson branch."""
+        pytest.importorskip("orjson")
+        self.assert_matches_stdlib(result, server._dumps(result))
+
+    @pytest.mark.parametrize("result", TOOL_RESULTS)
+    def test_stdlib_without_orjson(self, monkeypatch, result):
+        """Test the stdlib branch used when orjson is not installed."""
+        monkeypatch.setattr(server, "orjson", None)
+        self.assert_matches_stdlib(result, server._dumps(result))
+
+    def test_stdlib_fallback_for_wide_integers(self):
+        """Test that integers orjson cannot encode fall back to the stdlib encoder."""
+        pytest.importorskip("orjson")
+        result = {"value": 2 ** 70, "name": "Køb"}
+        self.assert_matches_stdlib(result, server._dumps(result))
@@ -0,0 +1,196 @@
+"""Unit tests for GTM tool dispatch."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from unboundai_gtm_mcp import tools as tools_module
+from unboundai_gtm_mcp.tools import GTMTools
+
+
+def make_client():
+    """Create a mock GTM client with a couple of canned responses."""
+    client = MagicMock()
+    client.get_tag = MagicMock(side_effect=lambda path: {"path": path})
+    client.get_variable = MagicMock(side_effect=RuntimeError("API error"))
+    client.list_accounts = MagicMock(return_value=[
+        {"accountId": "123", "name": "Account", "path": "accounts/123"}
+    ])
+    return client
+
+
+class TestBatchExecute:
+    """Test the gtm_batch_execute tool."""
+
+    @pytest.mark.asyncio
+    async def test_returns_results_in_order(self):
+        """Test that results are returned in operation order."""
+        tools = GTMTools()
+        result = await tools.execute_tool(
+            "gtm_batch_execute",
+            {
+                "operations": [
+                    {"name": "gtm_get_tag", "arguments": {"tag_path": "tags/1"}},
+                    {"name": "gtm_get_tag", "arguments": {"tag_path": "tags/2"}},
+                ],
+            },
+            make_client(),
+        )
+        assert result["results"] == [
+            {"name": "gtm_get_tag", "result": {"tag": {"path": "tags/1"}}},
+            {"name": "gtm_get_tag", "result": {"tag": {"path": "tags/2"}}},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_reports_errors_per_operation(self):
+        """Test that a failing operation does not fail the batch."""
+        tools = GTMTools()
+        result = await tools.execute_tool(
+            "gtm_batch_execute",
+            {
+                "operations": [
+                    {"name": "gtm_get_variable", "arguments": {"variable_path": "variables/1"}},
+                    {"name": "gtm_unknown"},
+                    {"name": "gtm_get_tag", "arguments": {"tag_path": "tags/1"}},
+                ]
+            },
+            make_client(),
+        )
+        results = result["results"]
+        assert results[0] == {"name": "gtm_get_variable", "error": "API error"}
+        assert results[1] == {"name": "gtm_unknown", "error": "Unknown tool: gtm_unknown"}
+        assert results[2]["result"] == {"tag": {"path": "tags/1"}}
+
+    @pytest.mark.asyncio
+    async def test_stop_on_error_skips_remaining(self):
+        """Test that stop_on_error skips operations after a failure."""
+        tools = GTMTools()
+        client = make_client()
+        result = await tools.execute_tool(
+            "gtm_batch_execute",
+            {
+                "operations": [
+                    {"name": "gtm_get_variable", "arguments": {"variable_path": "variables/1"}},
+                    {"name": "gtm_get_tag", "arguments": {"tag_path": "tags/1"}},
+                ],
+                "stop_on_error": True,
+            },
+            client,
+        )
+        assert result["results"][1] == {"name": "gtm_get_tag", "skipped": True}
+        client.get_tag.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rejects_nested_batches(self):
+        """Test that a batch cannot contain another batch."""
+        tools = GTMTools()
+        result = await tools.execute_tool(
+            "gtm_batch_execute",
+            {"operations": [{"name": "gtm_batch_execute", "arguments": {"operations": []}}]},
+            make_client(),
+        )
+        assert "cannot be nested" in result["results"][0]["error"]
+
+    @pytest.mark.asyncio
+    async def test_reports_malformed_operation(self):
+        """Test that a non-object operation fails on its own, not the whole batch."""
+        tools = GTMTools()
+        result = await tools.execute_tool(
+            "gtm_batch_execute",
+            {
+                "operations": [
+                    "gtm_get_tag",
+                    {"name": "gtm_get_tag", "arguments": {"tag_path": "tags/1"}},
+                ]
+            },
+            make_client(),
+        )
+        results = result["results"]
+        assert results[0] == {
+            "name": None,
+            "error": "Each operation must be an object with a 'name'",
+        }
+        assert results[1]["result"] == {"tag": {"path": "tags/1"}}
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_list_operations(self):
+        """Test that operations must be a list."""
+        tools = GTMTools()
+        with pytest.raises(ValueError, match="operations must be a list"):
+            await tools.execute_tool(
+                "gtm_batch_execute", {"operations": {"name": "gtm_get_tag"}}, make_client()
+            )
+
+
+class TestExecuteTool:
+    """Test GTMTools.execute_tool dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_dispatches_by_name(self):
+        """Test that a known tool name reaches its handler."""
+        tools = GTMTools()
+        result = await tools.execute_tool("gtm_get_tag", {"tag_path": "tags/1"}, make_client())
+        assert result == {"tag": {"path": "tags/1"}}
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool_raises(self):
+        """Test that an unknown tool name raises ValueError."""
+        tools = GTMTools()
+        with pytest.raises(ValueError) as exc_info:
+            await tools.execute_tool("gtm_unknown", {}, make_client())
+        assert "Unknown tool: gtm_unknown" in str(exc_info.value)
+
+
+class TestListAccountsCache:
+    """Test caching of gtm_list_accounts results."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_recent_result(self):
+        """Test that a second call within the TTL does not hit the API."""
+        tools = GTMTools()
+        client = make_client()
+        first = await tools.execute_tool("gtm_list_accounts", {}, client)
+        second = await tools.execute_tool("gtm_list_accounts", {}, client)
+        assert second == first
+        client.list_accounts.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_expires_after_ttl(self):
+        """Test that the API is queried again once the TTL has passed."""
+        tools = GTMTools()
+        client = make_client()
+        with patch.object(tools_module.time, "monotonic", return_value=1000.0):
+            await tools.execute_tool("gtm_list_accounts", {}, client)
+        later = 1000.0 + tools_module.ACCOUNTS_CACHE_TTL
+        with patch.object(tools_module.time, "monotonic", return_value=later):
+            await tools.execute_tool("gtm_list_accounts", {}, client)
+        assert client.list_accounts.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_not_shared_between_clients(self):
+        """Test that a different client does not get another client's result."""
+        tools = GTMTools()
+        first_client = make_client()
+        second_client = make_client()
+        await tools.execute_tool("gtm_list_accounts", {}, first_client)
+        await tools.execute_tool("gtm_list_accounts", {}, second_client)
+        second_client.list_accounts.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_invalidated_by_publish(self):
+        """Test that publishing a container clears the cached listing."""
+        tools = GTMTools()
+        client = make_client()
+        client.create_version = MagicMock(return_value={
+            "containerVersion": {"path": "accounts/123/containers/456/versions/7"}
+        })
+        client.publish_version = MagicMock(return_value={
+            "containerVersion": {"containerVersionId": "7", "name": "v7"}
+        })
+        await tools.execute_tool("gtm_list_accounts", {}, client)
+        await tools.execute_tool(
+            "gtm_publish_container",
+            {"workspace_path": "accounts/123/containers/456/workspaces/1", "version_name": "v7"},
+            client,
+        )
+        await tools.execute_tool("gtm_list_accounts", {}, client)
+        assert client.list_accounts.call_count == 2
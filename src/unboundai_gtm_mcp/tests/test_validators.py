@@ -27,35 +27,23 @@ from unboundai_gtm_mcp.validators import (
 class TestValidateAccountId:
     """Test validate_account_id function."""
 
-    def test_valid_account_id(self):
-        """Test validation of valid account ID."""
-        account_id = "1234567890"
-        result = validate_account_id(account_id)
-        assert result == account_id
-
-    def test_valid_long_account_id(self):
-        """Test validation of longer account ID."""
-        account_id = "12345678901234567890"
-        result = validate_account_id(account_id)
-        assert result == account_id
-
-    def test_empty_account_id(self):
-        """Test validation fails for empty account ID."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_account_id("")
-        assert "cannot be empty" in str(exc_info.value)
-
-    def test_non_numeric_account_id(self):
-        """Test validation fails for non-numeric account ID."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_account_id("abc123")
-        assert "must contain only digits" in str(exc_info.value)
-
-    def test_short_account_id(self):
-        """Test validation fails for account ID shorter than 10 digits."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_account_id("123456789")
-        assert "at least 10 digits" in str(exc_info.value)
+    @pytest.mark.parametrize("account_id", [
+        "1234567890",
+        "12345678901234567890",
+    ])
+    def test_valid_account_id(self, account_id):
+        """Test validation of valid account IDs."""
+        assert validate_account_id(account_id) == account_id
+
+    @pytest.mark.parametrize("account_id,message", [
+        ("", "cannot be empty"),
+        ("abc123", "must contain only digits"),
+        ("123456789", "at least 10 digits"),
+    ])
+    def test_invalid_account_id(self, account_id, message):
+        """Test validation fails for empty, non-numeric or short account IDs."""
+        with pytest.raises(ValidationError, match=message):
+            validate_account_id(account_id)
 
 
 class TestValidateContainerId:
@@ -63,21 +51,16 @@ class TestValidateContainerId:
 
     def test_valid_container_id(self):
         """Test validation of valid container ID."""
-        container_id = "123456"
-        result = validate_container_id(container_id)
-        assert result == container_id
+        assert validate_container_id("123456") == "123456"
 
-    def test_empty_container_id(self):
-        """Test validation fails for empty container ID."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_container_id("")
-        assert "cannot be empty" in str(exc_info.value)
-
-    def test_non_numeric_container_id(self):
-        """Test validation fails for non-numeric container ID."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_container_id("GTM-XXXXX")
-        assert "must contain only digits" in str(exc_info.value)
+    @pytest.mark.parametrize("container_id,message", [
+        ("", "cannot be empty"),
+        ("GTM-XXXXX", "must contain only digits"),
+    ])
+    def test_invalid_container_id(self, container_id, message):
+        """Test validation fails for empty or non-numeric container IDs."""
+        with pytest.raises(ValidationError, match=message):
+            validate_container_id(container_id)
 
 
 class TestValidateWorkspaceId:
@@ -85,399 +68,251 @@ class TestValidateWorkspaceId:
 
     def test_valid_workspace_id(self):
         """Test validation of valid workspace ID."""
-        workspace_id = "5"
-        result = validate_workspace_id(workspace_id)
-        assert result == workspace_id
-
-    def test_empty_workspace_id(self):
-        """Test validation fails for empty workspace ID."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_workspace_id("")
-        assert "cannot be empty" in str(exc_info.value)
+        assert validate_workspace_id("5") == "5"
 
-    def test_non_numeric_workspace_id(self):
-        """Test validation fails for non-numeric workspace ID."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_workspace_id("default")
-        assert "must contain only digits" in str(exc_info.value)
+    @pytest.mark.parametrize("workspace_id,message", [
+        ("", "cannot be empty"),
+        ("default", "must contain only digits"),
+    ])
+    def test_invalid_workspace_id(self, workspace_id, message):
+        """Test validation fails for empty or non-numeric workspace IDs."""
+        with pytest.raises(ValidationError, match=message):
+            validate_workspace_id(workspace_id)
 
 
 class TestValidateGtmPath:
     """Test validate_gtm_path function."""
 
-    def test_valid_container_path(self):
-        """Test validation of valid container path."""
-        path = "accounts/1234567890/containers/123456"
-        result = validate_gtm_path(path)
-        assert result == path
-
-    def test_valid_workspace_path(self):
-        """Test validation of valid workspace path."""
-        path = "accounts/1234567890/containers/123456/workspaces/5"
-        result = validate_gtm_path(path)
-        assert result == path
-
-    def test_empty_path(self):
-        """Test validation fails for empty path."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_gtm_path("")
-        assert "cannot be empty" in str(exc_info.value)
-
-    def test_path_without_accounts_prefix(self):
-        """Test validation fails for path without 'accounts/' prefix."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_gtm_path("containers/123456")
-        assert "must start with 'accounts/'" in str(exc_info.value)
-
-    def test_invalid_account_id_in_path(self):
-        """Test validation fails for non-numeric account ID in path."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_gtm_path("accounts/abc123/containers/456")
-        assert "Account ID in path must be numeric" in str(exc_info.value)
-
-    def test_validate_expected_type_present(self):
-        """Test validation succeeds when expected type is in path."""
-        path = "accounts/123/containers/456/workspaces/5"
-        result = validate_gtm_path(path, expected_type="workspace")
-        assert result == path
-
-    def test_validate_expected_type_missing(self):
-        """Test validation fails when expected type is not in path."""
-        path = "accounts/123/containers/456"
-        with pytest.raises(ValidationError) as exc_info:
-            validate_gtm_path(path, expected_type="workspace")
-        assert "does not contain expected type" in str(exc_info.value)
+    @pytest.mark.parametrize("path,expected_type", [
+        ("accounts/1234567890/containers/123456", None),
+        ("accounts/1234567890/containers/123456/workspaces/5", None),
+        ("accounts/123/containers/456/workspaces/5", "workspace"),
+        # Paths below the workspace level
+        ("accounts/123/containers/456/workspaces/5/tags/789", "tag"),
+    ])
+    def test_valid_path(self, path, expected_type):
+        """Test validation of valid paths, optionally of an expected type."""
+        assert validate_gtm_path(path, expected_type=expected_type) == path
+
+    @pytest.mark.parametrize("path,expected_type,message", [
+        ("", None, "cannot be empty"),
+        ("containers/123456", None, "must start with 'accounts/'"),
+        ("accounts/abc123/containers/456", None, "Account ID in path must be numeric"),
+        ("accounts/123/containers/456", "workspace", "does not contain expected type"),
+        # The expected type must match a whole collection segment
+        ("accounts/123/containers/456", "contain", "does not contain expected type"),
+    ])
+    def test_invalid_path(self, path, expected_type, message):
+        """Test validation fails for malformed paths or missing expected types."""
+        with pytest.raises(ValidationError, match=message):
+            validate_gtm_path(path, expected_type=expected_type)
 
 
 class TestValidateName:
     """Test validate_name function."""
 
-    def test_valid_name(self):
-        """Test validation of valid name."""
-        name = "GA4 - Config"
-        result = validate_name(name)
-        assert result == "GA4 - Config"
-
-    def test_name_with_whitespace(self):
-        """Test name with leading/trailing whitespace is trimmed."""
-        name = "  Test Name  "
-        result = validate_name(name)
-        assert result == "Test Name"
-
-    def test_empty_name(self):
-        """Test validation fails for empty name."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_name("")
-        assert "cannot be empty" in str(exc_info.value)
-
-    def test_non_string_name(self):
-        """Test validation fails for non-string name."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_name(123)  # type: ignore
-        assert "must be a string" in str(exc_info.value)
-
-    def test_name_exceeds_max_length(self):
-        """Test validation fails for name exceeding max length."""
-        long_name = "x" * 300
-        with pytest.raises(ValidationError) as exc_info:
-            validate_name(long_name)
-        assert "exceeds maximum length" in str(exc_info.value)
+    @pytest.mark.parametrize("name,expected", [
+        ("GA4 - Config", "GA4 - Config"),
+        # Leading/trailing whitespace is trimmed
+        ("  Test Name  ", "Test Name"),
+    ])
+    def test_valid_name(self, name, expected):
+        """Test validation of valid names."""
+        assert validate_name(name) == expected
+
+    @pytest.mark.parametrize("name,message", [
+        ("", "cannot be empty"),
+        (123, "must be a string"),
+        ("x" * 300, "exceeds maximum length"),
+    ])
+    def test_invalid_name(self, name, message):
+        """Test validation fails for empty, non-string or overlong names."""
+        with pytest.raises(ValidationError, match=message):
+            validate_name(name)
 
     def test_custom_field_name(self):
         """Test validation with custom field name."""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="(?i)tag_name"):
             validate_name("", field_name="tag_name")
-        assert "tag_name" in str(exc_info.value).lower()
 
 
 class TestValidateNotes:
     """Test validate_notes function."""
 
-    def test_valid_notes(self):
-        """Test validation of valid notes."""
-        notes = "This is a test note"
-        result = validate_notes(notes)
-        assert result == notes
-
-    def test_empty_notes(self):
-        """Test validation succeeds for empty notes."""
-        result = validate_notes("")
-        assert result == ""
-
-    def test_non_string_notes(self):
-        """Test validation fails for non-string notes."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_notes(123)  # type: ignore
-        assert "must be a string" in str(exc_info.value)
+    @pytest.mark.parametrize("notes", ["This is a test note", ""])
+    def test_valid_notes(self, notes):
+        """Test validation of valid notes, including empty notes."""
+        assert validate_notes(notes) == notes
 
-    def test_notes_exceed_max_length(self):
-        """Test validation fails for notes exceeding max length."""
-        long_notes = "x" * 6000
-        with pytest.raises(ValidationError) as exc_info:
-            validate_notes(long_notes)
-        assert "exceed maximum length" in str(exc_info.value)
+    @pytest.mark.parametrize("notes,message", [
+        (123, "must be a string"),
+        ("x" * 6000, "exceed maximum length"),
+    ])
+    def test_invalid_notes(self, notes, message):
+        """Test validation fails for non-string or overlong notes."""
+        with pytest.raises(ValidationError, match=message):
+            validate_notes(notes)
 
 
 class TestValidateTriggerType:
     """Test validate_trigger_type function."""
 
-    def test_valid_pageview_trigger(self):
-        """Test validation of valid PAGEVIEW trigger type."""
-        result = validate_trigger_type("PAGEVIEW")
-        assert result == "PAGEVIEW"
-
-    def test_valid_custom_event_trigger(self):
-        """Test validation of valid CUSTOM_EVENT trigger type."""
-        result = validate_trigger_type("CUSTOM_EVENT")
-        assert result == "CUSTOM_EVENT"
-
-    def test_valid_scroll_depth_trigger(self):
-        """Test validation of valid SCROLL_DEPTH trigger type."""
-        result = validate_trigger_type("SCROLL_DEPTH")
-        assert result == "SCROLL_DEPTH"
+    @pytest.mark.parametrize("trigger_type", ["PAGEVIEW", "CUSTOM_EVENT", "SCROLL_DEPTH"])
+    def test_valid_trigger_type(self, trigger_type):
+        """Test validation of valid trigger types."""
+        assert validate_trigger_type(trigger_type) == trigger_type
 
     def test_invalid_trigger_type(self):
         """Test validation fails for invalid trigger type."""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="Invalid trigger type"):
             validate_trigger_type("INVALID_TYPE")
-        assert "Invalid trigger type" in str(exc_info.value)
 
 
 class TestValidateTagType:
     """Test validate_tag_type function."""
 
-    def test_valid_tag_type(self):
-        """Test validation of valid tag type."""
-        result = validate_tag_type("gaawc")
-        assert result == "gaawc"
-
-    def test_custom_tag_type(self):
-        """Test validation allows custom tag types."""
-        result = validate_tag_type("custom_template")
-        assert result == "custom_template"
-
-    def test_empty_tag_type(self):
-        """Test validation fails for empty tag type."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_tag_type("")
-        assert "cannot be empty" in str(exc_info.value)
-
-    def test_non_string_tag_type(self):
-        """Test validation fails for non-string tag type."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_tag_type(123)  # type: ignore
-        assert "must be a string" in str(exc_info.value)
+    @pytest.mark.parametrize("tag_type", [
+        "gaawc",
+        # Custom tag types are allowed
+        "custom_template",
+    ])
+    def test_valid_tag_type(self, tag_type):
+        """Test validation of known and custom tag types."""
+        assert validate_tag_type(tag_type) == tag_type
+
+    @pytest.mark.parametrize("tag_type,message", [
+        ("", "cannot be empty"),
+        (123, "must be a string"),
+    ])
+    def test_invalid_tag_type(self, tag_type, message):
+        """Test validation fails for empty or non-string tag types."""
+        with pytest.raises(ValidationError, match=message):
+            validate_tag_type(tag_type)
 
 
 class TestValidateVariableType:
     """Test validate_variable_type function."""
 
-    def test_valid_variable_type(self):
-        """Test validation of valid variable type."""
-        result = validate_variable_type("c")
-        assert result == "c"
-
-    def test_custom_variable_type(self):
-        """Test validation allows custom variable types."""
-        result = validate_variable_type("custom_var")
-        assert result == "custom_var"
+    @pytest.mark.parametrize("variable_type", [
+        "c",
+        # Custom variable types are allowed
+        "custom_var",
+    ])
+    def test_valid_variable_type(self, variable_type):
+        """Test validation of known and custom variable types."""
+        assert validate_variable_type(variable_type) == variable_type
 
     def test_empty_variable_type(self):
         """Test validation fails for empty variable type."""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="cannot be empty"):
             validate_variable_type("")
-        assert "cannot be empty" in str(exc_info.value)
 
 
 class TestValidateScrollPercentages:
     """Test validate_scroll_percentages function."""
 
-    def test_valid_scroll_percentages(self):
-        """Test validation of valid scroll percentages."""
-        percentages = [25, 50, 75, 100]
-        result = validate_scroll_percentages(percentages)
-        assert result == [25, 50, 75, 100]
-
-    def test_scroll_percentages_sorted(self):
-        """Test scroll percentages are sorted."""
-        percentages = [75, 25, 100, 50]
-        result = validate_scroll_percentages(percentages)
-        assert result == [25, 50, 75, 100]
-
-    def test_scroll_percentages_deduplicated(self):
-        """Test duplicate scroll percentages are removed."""
-        percentages = [25, 50, 50, 75, 75]
-        result = validate_scroll_percentages(percentages)
-        assert result == [25, 50, 75]
-
-    def test_empty_scroll_percentages(self):
-        """Test validation fails for empty percentages list."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_scroll_percentages([])
-        assert "cannot be empty" in str(exc_info.value)
-
-    def test_non_list_scroll_percentages(self):
-        """Test validation fails for non-list input."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_scroll_percentages(50)  # type: ignore
-        assert "must be a list" in str(exc_info.value)
-
-    def test_non_integer_percentage(self):
-        """Test validation fails for non-integer percentage."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_scroll_percentages([25, "50", 75])  # type: ignore
-        assert "must be an integer" in str(exc_info.value)
-
-    def test_negative_percentage(self):
-        """Test validation fails for negative percentage."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_scroll_percentages([-10, 50])
-        assert "must be between 0 and 100" in str(exc_info.value)
-
-    def test_percentage_over_100(self):
-        """Test validation fails for percentage over 100."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_scroll_percentages([50, 150])
-        assert "must be between 0 and 100" in str(exc_info.value)
+    @pytest.mark.parametrize("percentages,expected", [
+        ([25, 50, 75, 100], [25, 50, 75, 100]),
+        # Sorted
+        ([75, 25, 100, 50], [25, 50, 75, 100]),
+        # Deduplicated
+        ([25, 50, 50, 75, 75], [25, 50, 75]),
+    ])
+    def test_valid_scroll_percentages(self, percentages, expected):
+        """Test that valid percentages are sorted and deduplicated."""
+        assert validate_scroll_percentages(percentages) == expected
+
+    @pytest.mark.parametrize("percentages,message", [
+        ([], "cannot be empty"),
+        (50, "must be a list"),
+        ([25, "50", 75], "must be an integer"),
+        ([25, True], "Percentage at index 1 must be an integer"),
+        ([25, 50.0], "Percentage at index 1 must be an integer"),
+        ([-10, 50], "must be between 0 and 100"),
+        ([50, 150], "Percentage at index 1 must be between 0 and 100"),
+    ])
+    def test_invalid_scroll_percentages(self, percentages, message):
+        """Test validation fails for empty, non-list, non-integer or out-of-range input."""
+        with pytest.raises(ValidationError, match=message):
+            validate_scroll_percentages(percentages)
 
 
 class TestValidateGA4EventName:
     """Test validate_ga4_event_name function."""
 
-    def test_valid_event_name(self):
-        """Test validation of valid event name."""
-        result = validate_ga4_event_name("purchase")
-        assert result == "purchase"
-
-    def test_valid_event_name_with_underscores(self):
-        """Test validation of event name with underscores."""
-        result = validate_ga4_event_name("add_to_cart")
-        assert result == "add_to_cart"
-
-    def test_valid_event_name_with_numbers(self):
-        """Test validation of event name with numbers."""
-        result = validate_ga4_event_name("event123")
-        assert result == "event123"
-
-    def test_empty_event_name(self):
-        """Test validation fails for empty event name."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_ga4_event_name("")
-        assert "cannot be empty" in str(exc_info.value)
-
-    def test_event_name_too_long(self):
-        """Test validation fails for event name exceeding max length."""
-        long_name = "x" * 50
-        with pytest.raises(ValidationError) as exc_info:
-            validate_ga4_event_name(long_name)
-        assert "exceeds maximum length" in str(exc_info.value)
-
-    def test_event_name_starts_with_number(self):
-        """Test validation fails for event name starting with number."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_ga4_event_name("123event")
-        assert "must start with a letter" in str(exc_info.value)
-
-    def test_event_name_with_spaces(self):
-        """Test validation fails for event name with spaces."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_ga4_event_name("my event")
-        assert "can only contain" in str(exc_info.value)
-
-    def test_event_name_with_hyphens(self):
-        """Test validation fails for event name with hyphens."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_ga4_event_name("my-event")
-        assert "can only contain" in str(exc_info.value)
+    @pytest.mark.parametrize("event_name", ["purchase", "add_to_cart", "event123"])
+    def test_valid_event_name(self, event_name):
+        """Test validation of valid event names."""
+        assert validate_ga4_event_name(event_name) == event_name
+
+    @pytest.mark.parametrize("event_name,message", [
+        ("", "cannot be empty"),
+        ("x" * 50, "exceeds maximum length"),
+        ("123event", "must start with a letter"),
+        ("my event", "can only contain"),
+        ("my-event", "can only contain"),
+        ("purchase\n", "can only contain"),
+        ("café", "can only contain"),
+    ])
+    def test_invalid_event_name(self, event_name, message):
+        """Test validation fails for empty, overlong or malformed event names."""
+        with pytest.raises(ValidationError, match=message):
+            validate_ga4_event_name(event_name)
 
 
 class TestValidateGA4ParameterName:
     """Test validate_ga4_parameter_name function."""
 
-    def test_valid_parameter_name(self):
-        """Test validation of valid parameter name."""
-        result = validate_ga4_parameter_name("currency")
-        assert result == "currency"
-
-    def test_valid_parameter_name_with_underscores(self):
-        """Test validation of parameter name with underscores."""
-        result = validate_ga4_parameter_name("transaction_id")
-        assert result == "transaction_id"
+    @pytest.mark.parametrize("param_name", ["currency", "transaction_id"])
+    def test_valid_parameter_name(self, param_name):
+        """Test validation of valid parameter names."""
+        assert validate_ga4_parameter_name(param_name) == param_name
 
-    def test_empty_parameter_name(self):
-        """Test validation fails for empty parameter name."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_ga4_parameter_name("")
-        assert "cannot be empty" in str(exc_info.value)
-
-    def test_parameter_name_too_long(self):
-        """Test validation fails for parameter name exceeding max length."""
-        long_name = "x" * 50
-        with pytest.raises(ValidationError) as exc_info:
-            validate_ga4_parameter_name(long_name)
-        assert "exceeds maximum length" in str(exc_info.value)
+    @pytest.mark.parametrize("param_name,message", [
+        ("", "cannot be empty"),
+        ("x" * 50, "exceeds maximum length"),
+    ])
+    def test_invalid_parameter_name(self, param_name, message):
+        """Test validation fails for empty or overlong parameter names."""
+        with pytest.raises(ValidationError, match=message):
+            validate_ga4_parameter_name(param_name)
 
 
 class TestValidateEventParameters:
     """Test validate_event_parameters function."""
 
-    def test_valid_event_parameters(self):
-        """Test validation of valid event parameters."""
-        params = [
-            {"name": "currency", "value": "DKK"},
-            {"name": "value", "value": "100"}
-        ]
-        result = validate_event_parameters(params)
-        assert result == params
-
-    def test_empty_parameters_list(self):
-        """Test validation succeeds for empty parameters list."""
-        result = validate_event_parameters([])
-        assert result == []
-
-    def test_non_list_parameters(self):
-        """Test validation fails for non-list input."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_event_parameters({"name": "test"})  # type: ignore
-        assert "must be a list" in str(exc_info.value)
-
-    def test_non_dict_parameter(self):
-        """Test validation fails for non-dict parameter."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_event_parameters(["invalid"])  # type: ignore
-        assert "must be a dictionary" in str(exc_info.value)
-
-    def test_parameter_missing_name(self):
-        """Test validation fails for parameter missing 'name' key."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_event_parameters([{"value": "test"}])
-        assert "missing 'name' key" in str(exc_info.value)
-
-    def test_parameter_missing_value(self):
-        """Test validation fails for parameter missing 'value' key."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_event_parameters([{"name": "test"}])
-        assert "missing 'value' key" in str(exc_info.value)
+    @pytest.mark.parametrize("params", [
+        [{"name": "currency", "value": "DKK"}, {"name": "value", "value": "100"}],
+        [],
+    ])
+    def test_valid_event_parameters(self, params):
+        """Test validation of valid parameter lists, including an empty list."""
+        assert validate_event_parameters(params) == params
+
+    @pytest.mark.parametrize("params,message", [
+        ({"name": "test"}, "must be a list"),
+        (["invalid"], "must be a dictionary"),
+        ([{"value": "test"}], "missing 'name' key"),
+        ([{"name": "test"}], "missing 'value' key"),
+    ])
+    def test_invalid_event_parameters(self, params, message):
+        """Test validation fails for malformed parameter lists."""
+        with pytest.raises(ValidationError, match=message):
+            validate_event_parameters(params)
 
 
 class TestValidateFilterType:
     """Test validate_filter_type function."""
 
-    def test_valid_equals_filter(self):
-        """Test validation of EQUALS filter type."""
-        result = validate_filter_type("EQUALS")
-        assert result == "EQUALS"
-
-    def test_valid_contains_filter(self):
-        """Test validation of CONTAINS filter type."""
-        result = validate_filter_type("CONTAINS")
-        assert result == "CONTAINS"
+    @pytest.mark.parametrize("filter_type", ["EQUALS", "CONTAINS"])
+    def test_valid_filter_type(self, filter_type):
+        """Test validation of valid filter types."""
+        assert validate_filter_type(filter_type) == filter_type
 
     def test_invalid_filter_type(self):
         """Test validation fails for invalid filter type."""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="Invalid filter type"):
             validate_filter_type("INVALID")
-        assert "Invalid filter type" in str(exc_info.value)
 
 
 class TestValidateTriggerIds:
@@ -486,120 +321,71 @@ class TestValidateTriggerIds:
     def test_valid_trigger_ids(self):
         """Test validation of valid trigger IDs."""
         ids = ["123", "456", "789"]
-        result = validate_trigger_ids(ids)
-        assert result == ids
-
-    def test_empty_trigger_ids(self):
-        """Test validation fails for empty list."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_trigger_ids([])
-        assert "cannot be empty" in str(exc_info.value)
-
-    def test_non_list_trigger_ids(self):
-        """Test validation fails for non-list input."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_trigger_ids("123")  # type: ignore
-        assert "must be a list" in str(exc_info.value)
-
-    def test_non_string_trigger_id(self):
-        """Test validation fails for non-string trigger ID."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_trigger_ids([123, 456])  # type: ignore
-        assert "must be a string" in str(exc_info.value)
-
-    def test_empty_string_trigger_id(self):
-        """Test validation fails for empty string trigger ID."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_trigger_ids(["123", "", "789"])
-        assert "cannot be empty" in str(exc_info.value)
+        assert validate_trigger_ids(ids) == ids
+
+    @pytest.mark.parametrize("trigger_ids,message", [
+        ([], "cannot be empty"),
+        ("123", "must be a list"),
+        ([123, 456], "must be a string"),
+        (["123", "", "789"], "Trigger ID at index 1 cannot be empty"),
+        (["123", "456", "   "], "Trigger ID at index 2 cannot be empty"),
+    ])
+    def test_invalid_trigger_ids(self, trigger_ids, message):
+        """Test validation fails for empty, non-list or malformed trigger IDs."""
+        with pytest.raises(ValidationError, match=message):
+            validate_trigger_ids(trigger_ids)
 
 
 class TestValidateCssSelector:
     """Test validate_css_selector function."""
 
-    def test_valid_css_selector(self):
-        """Test validation of valid CSS selector."""
-        result = validate_css_selector("#my-element")
-        assert result == "#my-element"
-
-    def test_valid_class_selector(self):
-        """Test validation of valid class selector."""
-        result = validate_css_selector(".my-class")
-        assert result == ".my-class"
-
-    def test_valid_complex_selector(self):
-        """Test validation of complex CSS selector."""
-        result = validate_css_selector("div.class > p[data-attr='value']")
-        assert result == "div.class > p[data-attr='value']"
-
-    def test_empty_css_selector(self):
-        """Test validation fails for empty selector."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_css_selector("")
-        assert "cannot be empty" in str(exc_info.value)
-
-    def test_non_string_css_selector(self):
-        """Test validation fails for non-string selector."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_css_selector(123)  # type: ignore
-        assert "must be a string" in str(exc_info.value)
-
-    def test_selector_with_leading_whitespace(self):
-        """Test validation fails for selector with leading whitespace."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_css_selector("  #element")
-        assert "cannot start or end with whitespace" in str(exc_info.value)
-
-    def test_selector_with_trailing_whitespace(self):
-        """Test validation fails for selector with trailing whitespace."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_css_selector("#element  ")
-        assert "cannot start or end with whitespace" in str(exc_info.value)
+    @pytest.mark.parametrize("selector", [
+        "#my-element",
+        ".my-class",
+        "div.class > p[data-attr='value']",
+    ])
+    def test_valid_css_selector(self, selector):
+        """Test validation of ID, class and complex selectors."""
+        assert validate_css_selector(selector) == selector
+
+    @pytest.mark.parametrize("selector,message", [
+        ("", "cannot be empty"),
+        (123, "must be a string"),
+        ("  #element", "cannot start or end with whitespace"),
+        ("#element  ", "cannot start or end with whitespace"),
+    ])
+    def test_invalid_css_selector(self, selector, message):
+        """Test validation fails for empty, non-string or untrimmed selectors."""
+        with pytest.raises(ValidationError, match=message):
+            validate_css_selector(selector)
 
 
 class TestValidatePositiveInteger:
     """Test validate_positive_integer function."""
 
-    def test_valid_positive_integer(self):
-        """Test validation of valid positive integer."""
-        result = validate_positive_integer(42)
-        assert result == 42
-
-    def test_minimum_value(self):
-        """Test validation with minimum value."""
-        result = validate_positive_integer(1, min_value=1)
-        assert result == 1
-
-    def test_custom_minimum_value(self):
-        """Test validation with custom minimum value."""
-        result = validate_positive_integer(10, min_value=5)
-        assert result == 10
-
-    def test_value_below_minimum(self):
-        """Test validation fails for value below minimum."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_positive_integer(0, min_value=1)
-        assert ">= 1" in str(exc_info.value)
-
-    def test_maximum_value(self):
-        """Test validation with maximum value."""
-        result = validate_positive_integer(50, max_value=100)
-        assert result == 50
-
-    def test_value_above_maximum(self):
-        """Test validation fails for value above maximum."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_positive_integer(150, max_value=100)
-        assert "<= 100" in str(exc_info.value)
-
-    def test_non_integer_value(self):
-        """Test validation fails for non-integer value."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_positive_integer("42")  # type: ignore
-        assert "must be an integer" in str(exc_info.value)
+    @pytest.mark.parametrize("value,kwargs", [
+        (42, {}),
+        (1, {"min_value": 1}),
+        (10, {"min_value": 5}),
+        (50, {"max_value": 100}),
+    ])
+    def test_valid_positive_integer(self, value, kwargs):
+        """Test validation of integers within the allowed range."""
+        assert validate_positive_integer(value, **kwargs) == value
+
+    @pytest.mark.parametrize("value,kwargs,message", [
+        (0, {"min_value": 1}, ">= 1"),
+        (150, {"max_value": 100}, "<= 100"),
+        ("42", {}, "must be an integer"),
+        (1.5, {}, "must be an integer"),
+        (True, {}, "must be an integer"),
+    ])
+    def test_invalid_positive_integer(self, value, kwargs, message):
+        """Test validation fails for out-of-range or non-integer values."""
+        with pytest.raises(ValidationError, match=message):
+            validate_positive_integer(value, **kwargs)
 
     def test_custom_field_name(self):
         """Test validation with custom field name."""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="(?i)timeout"):
             validate_positive_integer("test", field_name="timeout")  # type: ignore
-        assert "timeout" in str(exc_info.value).lower()
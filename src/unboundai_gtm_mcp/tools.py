@@ -1,19 +1,24 @@
 """GTM tool implementations for MCP."""
 
 import asyncio
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, Optional, Tuple
 from .gtm_client import GTMClient
 from .helpers import build_custom_event_filter
 
 
+# How long a gtm_list_accounts result is reused, in seconds
+ACCOUNTS_CACHE_TTL = 60.0
+
+
 class GTMTools:
     """Container for GTM tool implementations."""
 
-    async def execute_tool(
-        self, name: str, arguments: Optional[Dict[str, Any]], client: GTMClient
-    ) -> Dict[str, Any]:
-        """Execute a tool by name."""
-        tool_map = {
+    def __init__(self) -> None:
+        # (client, fetched at, result) of the last gtm_list_accounts call
+        self._accounts_cache: Optional[Tuple[GTMClient, float, Dict[str, Any]]] = None
+        # Tool name -> handler, built once rather than on every call
+        self._handlers = {
             "gtm_list_accounts": self._list_accounts,
             "gtm_list_containers": self._list_containers,
             "gtm_list_tags": self._list_tags,
@@ -34,9 +39,14 @@ class GTMTools:
             "gtm_undelete_version": self._undelete_version,
             "gtm_update_version": self._update_version,
             "gtm_set_latest_version": self._set_latest_version,
+            "gtm_batch_execute": self._batch_execute,
         }
 
-        handler = tool_map.get(name)
+    async def execute_tool(
+        self, name: str, arguments: Optional[Dict[str, Any]], client: GTMClient
+    ) -> Dict[str, Any]:
+        """Execute a tool by name."""
+        handler = self._handlers.get(name)
         if not handler:
             raise ValueError(f"Unknown tool: {name}")
 
@@ -45,9 +55,17 @@ class GTMTools:
     async def _list_accounts(
         self, args: Dict[str, Any], client: GTMClient
     ) -> Dict[str, Any]:
-        """List GTM accounts."""
+        """List GTM accounts, reusing a recent result for the same client."""
+        cached = self._accounts_cache
+        if (
+            cached is not None
+            and cached[0] is client
+            and time.monotonic() - cached[1] < ACCOUNTS_CACHE_TTL
+        ):
+            return cached[2]
+
         accounts = await asyncio.to_thread(client.list_accounts)
-        return {
+        result = {
             "accounts": [
                 {
                     "accountId": acc.get("accountId"),
@@ -57,6 +75,8 @@ class GTMTools:
                 for acc in accounts
             ]
         }
+        self._accounts_cache = (client, time.monotonic(), result)
+        return result
 
     async def _list_containers(
         self, args: Dict[str, Any], client: GTMClient
@@ -313,6 +333,8 @@ class GTMTools:
 
         # Publish version
         result = await asyncio.to_thread(client.publish_version, version_path)
+        # Drop the cached account listing so reads after a publish are fresh
+        self._accounts_cache = None
         return {
             "success": True,
             "version": {
@@ -572,3 +594,36 @@ class GTMTools:
                 "path": version.get("containerVersion", {}).get("path"),
             }
         }
+
+    async def _batch_execute(
+        self, args: Dict[str, Any], client: GTMClient
+    ) -> Dict[str, Any]:
+        """Run several tool calls in order, returning one result or error per operation."""
+        operations = args["operations"]
+        if not isinstance(operations, list):
+            raise ValueError("operations must be a list")
+        stop_on_error = bool(args.get("stop_on_error", False))
+
+        # Operations run one at a time: they all share the client's
+        # googleapiclient service, whose HTTP connection is not thread-safe
+        results = []
+        failed = False
+        for operation in operations:
+            name = None
+            try:
+                if not isinstance(operation, dict):
+                    raise ValueError("Each operation must be an object with a 'name'")
+                name = operation.get("name")
+                # With stop_on_error, operations after a failure are skipped
+                if stop_on_error and failed:
+                    results.append({"name": name, "skipped": True})
+                    continue
+                if name == "gtm_batch_execute":
+                    raise ValueError("gtm_batch_execute cannot be nested")
+                result = await self.execute_tool(name, operation.get("arguments"), client)
+                results.append({"name": name, "result": result})
+            except Exception as e:
+                failed = True
+                results.append({"name": name, "error": str(e)})
+
+        return {"results": results}
@@ -1,8 +1,10 @@
 import os
+import sys
 from pathlib import Path
 from typing import List
-from googleapiclient.discovery import build
 import google.auth
+import google.auth.credentials
+import google.auth.exceptions
 
 
 class GTMAuth:
@@ -35,8 +37,15 @@ class GTMAuth:
         Returns:
             Google API service client
         """
-        credentials = self._create_credentials()
-        self.credentials = credentials
+        # Credentials refresh themselves when they expire, so the ones loaded
+        # on the first call are reused rather than looked up again
+        credentials = self.credentials
+        if credentials is None:
+            credentials = self.credentials = self._create_credentials()
+        # googleapiclient.discovery is slow to import, so it is only loaded
+        # once a client is actually built
+        from googleapiclient.discovery import build
+
         service = build(self.service_name, self.version, credentials=credentials)
         return service
 
@@ -98,9 +107,9 @@ class GTMAuth:
         try:
             credentials, project = google.auth.default(scopes=self.scopes)
             
-            print(f"✓ Authenticated using Application Default Credentials")
-            print(f"✓ Credentials file: {credentials_path}")
-            print(f"✓ Project ID: {project_id}")
+            print(f"✓ Authenticated using Application Default Credentials", file=sys.stderr)
+            print(f"✓ Credentials file: {credentials_path}", file=sys.stderr)
+            print(f"✓ Project ID: {project_id}", file=sys.stderr)
             
             return credentials
         except google.auth.exceptions.DefaultCredentialsError as e:
@@ -4,15 +4,17 @@ This module provides comprehensive validation for GTM API inputs including
 IDs, names, paths, and configuration values with clear error messages.
 """
 
-import re
-from typing import Any, Dict, List, Optional, Union
+import string
+from typing import Any, Dict, Final, FrozenSet, List, Optional, Union
 
 from .constants import (
+    FILTER_TYPES,
     GA4_EVENT_NAME_MAX_LENGTH,
     GA4_PARAMETER_NAME_MAX_LENGTH,
     GTM_NAME_MAX_LENGTH,
     GTM_NOTES_MAX_LENGTH,
     SCROLL_PERCENTAGES,
+    TRIGGER_TYPES,
     FilterType,
     ParameterType,
     TagType,
@@ -21,6 +23,12 @@ from .constants import (
 )
 from .exceptions import ValidationError
 
+# Characters allowed in GA4 event and parameter names. The leading-letter
+# rule is checked separately, so a subset test covers the rest of the name.
+_GA4_NAME_CHARS: Final[FrozenSet[str]] = frozenset(
+    string.ascii_letters + string.digits + "_"
+)
+
 
 def validate_account_id(account_id: str) -> str:
     """Validate GTM account ID format.
@@ -135,26 +143,18 @@ def validate_gtm_path(
             expected="accounts/{accountId}/..."
         )
 
-    parts = path.split("/")
-    if len(parts) < 2:
-        raise ValidationError(
-            "Invalid path format",
-            field="path",
-            value=path,
-            expected="accounts/{accountId}/..."
-        )
-
-    # Validate account ID part
-    if not parts[1].isdigit():
+    # Validate account ID part (the segment after 'accounts/')
+    account_id = path[9:].partition("/")[0]
+    if not account_id.isdigit():
         raise ValidationError(
             "Account ID in path must be numeric",
             field="path",
             value=path
         )
 
-    # Validate expected type if provided
+    # Validate expected type if provided, matching whole path segments
     if expected_type:
-        if expected_type not in path:
+        if f"/{expected_type}s/" not in f"/{path}/":
             raise ValidationError(
                 f"Path does not contain expected type '{expected_type}'",
                 field="path",
@@ -251,17 +251,16 @@ def validate_trigger_type(trigger_type: str) -> str:
     Raises:
         ValidationError: If trigger type is invalid
     """
-    try:
-        TriggerType(trigger_type)
+    if isinstance(trigger_type, str) and trigger_type in TRIGGER_TYPES:
         return trigger_type
-    except ValueError:
-        valid_types = [t.value for t in TriggerType]
-        raise ValidationError(
-            f"Invalid trigger type: {trigger_type}",
-            field="trigger_type",
-            value=trigger_type,
-            expected=f"one of {valid_types}"
-        )
+
+    valid_types = [t.value for t in TriggerType]
+    raise ValidationError(
+        f"Invalid trigger type: {trigger_type}",
+        field="trigger_type",
+        value=trigger_type,
+        expected=f"one of {valid_types}"
+    )
 
 
 def validate_tag_type(tag_type: str) -> str:
@@ -349,22 +348,28 @@ def validate_scroll_percentages(percentages: List[int]) -> List[int]:
             expected="list of integers"
         )
 
-    for i, pct in enumerate(percentages):
-        if not isinstance(pct, int):
-            raise ValidationError(
-                f"Percentage at index {i} must be an integer",
-                field="percentages",
-                value=type(pct).__name__,
-                expected="integer"
-            )
+    # Check the whole list in one pass; only locate the offending index on failure
+    if not all(type(pct) is int for pct in percentages):
+        i, pct = next(
+            (i, pct) for i, pct in enumerate(percentages) if type(pct) is not int
+        )
+        raise ValidationError(
+            f"Percentage at index {i} must be an integer",
+            field="percentages",
+            value=type(pct).__name__,
+            expected="integer"
+        )
 
-        if pct < 0 or pct > 100:
-            raise ValidationError(
-                f"Percentage at index {i} must be between 0 and 100",
-                field="percentages",
-                value=pct,
-                expected="0-100"
-            )
+    if min(percentages) < 0 or max(percentages) > 100:
+        i, pct = next(
+            (i, pct) for i, pct in enumerate(percentages) if pct < 0 or pct > 100
+        )
+        raise ValidationError(
+            f"Percentage at index {i} must be between 0 and 100",
+            field="percentages",
+            value=pct,
+            expected="0-100"
+        )
 
     # Remove duplicates and sort
     return sorted(set(percentages))
@@ -406,7 +411,7 @@ def validate_ga4_event_name(event_name: str) -> str:
         )
 
     # GA4 event names can only contain letters, numbers, and underscores
-    if not re.match(r'^[a-zA-Z][a-zA-Z0-9_]*$', event_name):
+    if not _GA4_NAME_CHARS.issuperset(event_name):
         raise ValidationError(
             "Event name can only contain letters, numbers, and underscores",
             field="event_name",
@@ -450,7 +455,7 @@ def validate_ga4_parameter_name(param_name: str) -> str:
         )
 
     # GA4 parameter names can only contain letters, numbers, and underscores
-    if not re.match(r'^[a-zA-Z][a-zA-Z0-9_]*$', param_name):
+    if not _GA4_NAME_CHARS.issuperset(param_name):
         raise ValidationError(
             "Parameter name can only contain letters, numbers, and underscores",
             field="parameter_name",
@@ -521,17 +526,16 @@ def validate_filter_type(filter_type: str) -> str:
     Raises:
         ValidationError: If filter type is invalid
     """
-    try:
-        FilterType(filter_type)
+    if isinstance(filter_type, str) and filter_type in FILTER_TYPES:
         return filter_type
-    except ValueError:
-        valid_types = [t.value for t in FilterType]
-        raise ValidationError(
-            f"Invalid filter type: {filter_type}",
-            field="filter_type",
-            value=filter_type,
-            expected=f"one of {valid_types}"
-        )
+
+    valid_types = [t.value for t in FilterType]
+    raise ValidationError(
+        f"Invalid filter type: {filter_type}",
+        field="filter_type",
+        value=filter_type,
+        expected=f"one of {valid_types}"
+    )
 
 
 def validate_trigger_ids(trigger_ids: List[str]) -> List[str]:
@@ -560,6 +564,14 @@ def validate_trigger_ids(trigger_ids: List[str]) -> List[str]:
             expected="list of strings"
         )
 
+    # Check the whole list in one pass; walk it for the offending index only
+    # on failure. isspace() is False for "", so empty IDs fail the first test.
+    if all(
+        type(trigger_id) is str and trigger_id and not trigger_id.isspace()
+        for trigger_id in trigger_ids
+    ):
+        return trigger_ids
+
     for i, trigger_id in enumerate(trigger_ids):
         if not isinstance(trigger_id, str):
             raise ValidationError(
@@ -637,7 +649,8 @@ def validate_positive_integer(
     Raises:
         ValidationError: If value is invalid
     """
-    if not isinstance(value, int):
+    # Exact type check: bool is an int subclass and must not pass as a count
+    if type(value) is not int:
         raise ValidationError(
             f"{field_name.capitalize()} must be an integer",
             field=field_name,
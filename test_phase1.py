@@ -2,16 +2,15 @@
 """Quick test script for Phase 1 implementation."""
 
 import sys
-sys.path.insert(0, 'src')
 
-from gtm_mcp.exceptions import ValidationError, GTMError, ParameterFormatError
-from gtm_mcp.constants import TriggerType, TagType, VariableType, SCROLL_PERCENTAGES
-from gtm_mcp.validators import (
+from unboundai_gtm_mcp.exceptions import ValidationError, GTMError, ParameterFormatError
+from unboundai_gtm_mcp.constants import TriggerType, TagType, VariableType, SCROLL_PERCENTAGES
+from unboundai_gtm_mcp.validators import (
     validate_account_id,
     validate_ga4_event_name,
     validate_scroll_percentages,
 )
-from gtm_mcp.helpers import (
+from unboundai_gtm_mcp.helpers import (
     build_ga4_config_tag,
     build_ga4_event_tag,
     build_scroll_percentage_list,
@@ -163,15 +162,15 @@ def main():
 
         print("Phase 1 implementation is complete and working!")
         print("\nModules created:")
-        print("  • src/gtm_mcp/exceptions.py")
-        print("  • src/gtm_mcp/constants.py")
-        print("  • src/gtm_mcp/validators.py")
-        print("  • src/gtm_mcp/helpers.py")
+        print("  • src/unboundai_gtm_mcp/exceptions.py")
+        print("  • src/unboundai_gtm_mcp/constants.py")
+        print("  • src/unboundai_gtm_mcp/validators.py")
+        print("  • src/unboundai_gtm_mcp/helpers.py")
         print("\nTest files created:")
-        print("  • src/gtm_mcp/tests/test_exceptions.py")
-        print("  • src/gtm_mcp/tests/test_constants.py")
-        print("  • src/gtm_mcp/tests/test_validators.py")
-        print("  • src/gtm_mcp/tests/test_helpers.py")
+        print("  • src/unboundai_gtm_mcp/tests/test_exceptions.py")
+        print("  • src/unboundai_gtm_mcp/tests/test_constants.py")
+        print("  • src/unboundai_gtm_mcp/tests/test_validators.py")
+        print("  • src/unboundai_gtm_mcp/tests/test_helpers.py")
 
         return 0
 